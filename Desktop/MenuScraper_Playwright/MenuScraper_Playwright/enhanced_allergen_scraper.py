@@ -9,6 +9,7 @@ import re
 import json
 import time
 import logging
+from collections import Counter
 from typing import Dict, List, Any, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
@@ -157,13 +158,11 @@ class AllergenDetector:
             ]
         }
     
-    def detect_allergens(self, text: str) -> Tuple[List[AllergenType], Dict[str, float]]:
-        """Detect allergens in menu item text with confidence scoring"""
+    def detect_allergens(self, text_lower: str) -> Tuple[List[AllergenType], Dict[str, float]]:
+        """Detect allergens in already-lowercased menu item text with confidence scoring"""
         detected_allergens = []
         confidence_scores = {}
         
-        text_lower = text.lower()
-        
         for allergen_type, keyword_groups in self.allergen_keywords.items():
             max_confidence = 0.0
             found_keywords = []
@@ -213,10 +212,9 @@ class AllergenDetector:
         
         return False
     
-    def detect_dietary_tags(self, text: str) -> List[str]:
-        """Detect dietary restriction tags"""
+    def detect_dietary_tags(self, text_lower: str) -> List[str]:
+        """Detect dietary restriction tags in already-lowercased text"""
         detected_tags = []
-        text_lower = text.lower()
         
         for tag, patterns in self.dietary_patterns.items():
             for pattern in patterns:
@@ -226,16 +224,35 @@ class AllergenDetector:
         
         return list(set(detected_tags))
 
+_DETECTOR_SINGLETON: Optional[AllergenDetector] = None
+
+def get_allergen_detector() -> AllergenDetector:
+    """Return the shared AllergenDetector, building it on first use"""
+    global _DETECTOR_SINGLETON
+    if _DETECTOR_SINGLETON is None:
+        _DETECTOR_SINGLETON = AllergenDetector()
+    return _DETECTOR_SINGLETON
+
 class EnhancedMenuScraper:
     """Enhanced menu scraper with allergen detection"""
     
     def __init__(self):
-        self.allergen_detector = AllergenDetector()
+        # The detector is read-only after construction, so every scraper shares one
+        self.allergen_detector = get_allergen_detector()
+        
+        # Item validation patterns, compiled once per scraper
+        self._nav_re = re.compile(r'\b(?:home|about|contact|menu|location|hours|order\s+online)\b', re.IGNORECASE)
+        self._price_only_re = re.compile(r'^\$?\d+(?:\.\d{2})?$')
+        self._dollar_price_re = re.compile(r'\$\d+(?:\.\d{2})?')
         self.price_patterns = [
             r'\$\d+(?:\.\d{2})?',
             r'\d+(?:\.\d{2})?\s*(?:dollars?|usd|\$)',
             r'\b\d{1,3}(?:,\d{3})*(?:\.\d{2})?\b',
         ]
+        # One capturing alternative per pattern so a single scan rejects
+        # price-less text; the individual patterns resolve precedence
+        self._price_re = re.compile('|'.join(f'({pattern})' for pattern in self.price_patterns))
+        self._price_pattern_res = [re.compile(pattern) for pattern in self.price_patterns]
         
         # Enhanced CSS selectors
         self.menu_selectors = [
@@ -261,6 +278,13 @@ class EnhancedMenuScraper:
             'div:has-text("$"):not(:has(div:has-text("$")))',
             'p:has-text("$")',
         ]
+        
+        # Comma-joined unions so each group is a single query_selector_all
+        # round-trip; Playwright's :has-text() fallbacks form their own group
+        self._selector_groups = [
+            ', '.join(sel for sel in self.menu_selectors if ':has-text(' not in sel),
+            ', '.join(sel for sel in self.menu_selectors if ':has-text(' in sel),
+        ]
     
     def enhanced_menu_detection(self, page: Page, url: str) -> Dict[str, Any]:
         """Enhanced menu detection with allergen analysis"""
@@ -318,54 +342,41 @@ class EnhancedMenuScraper:
             valid_items = [item for item in unique_items if self._is_valid_menu_item(item)]
             
             if valid_items:
-                # Analyze allergens and dietary information
-                all_allergens = set()
+                # Build serializable items and collect statistics in one pass
+                serializable_items = []
                 all_dietary_tags = set()
-                category_counts = {}
+                category_counts = Counter()
+                allergen_summary = Counter()
                 total_confidence = 0
                 
                 for item in valid_items:
-                    # Collect statistics
-                    for allergen in item.allergens:
-                        all_allergens.add(allergen.value)
-                    all_dietary_tags.update(item.dietary_tags)
-                    
-                    category = item.category
-                    category_counts[category] = category_counts.get(category, 0) + 1
-                    total_confidence += item.confidence_score
-                
-                # Convert to serializable format
-                serializable_items = []
-                for item in valid_items:
+                    allergens = [a.value for a in item.allergens]
                     serializable_items.append({
                         'name': item.name,
                         'description': item.description,
                         'price': item.price,
                         'category': item.category,
-                        'allergens': [a.value for a in item.allergens],
+                        'allergens': allergens,
                         'allergen_confidence': item.allergen_confidence,
                         'dietary_tags': item.dietary_tags,
                         'confidence': item.confidence_score,
                         'extraction_method': item.extraction_method
                     })
+                    
+                    allergen_summary.update(allergens)
+                    all_dietary_tags.update(item.dietary_tags)
+                    category_counts[item.category] += 1
+                    total_confidence += item.confidence_score
                 
                 result['menu_items'] = serializable_items
                 result['total_items'] = len(serializable_items)
                 result['scraping_success'] = len(serializable_items) >= 3
                 result['dietary_tags_detected'] = list(all_dietary_tags)
-                result['category_distribution'] = category_counts
-                
-                # Allergen summary
-                allergen_summary = {allergen: 0 for allergen in all_allergens}
-                for item in serializable_items:
-                    for allergen in item['allergens']:
-                        if allergen in allergen_summary:
-                            allergen_summary[allergen] += 1
-                result['allergen_summary'] = allergen_summary
+                result['category_distribution'] = dict(category_counts)
+                result['allergen_summary'] = dict(allergen_summary)
                 
                 # Overall confidence
-                if valid_items:
-                    result['confidence_score'] = round(total_confidence / len(valid_items), 3)
+                result['confidence_score'] = round(total_confidence / len(valid_items), 3)
             
             result['processing_time'] = round(time.time() - start_time, 2)
             
@@ -382,20 +393,25 @@ class EnhancedMenuScraper:
         """Extract menu items using CSS selectors"""
         items = []
         
-        for selector in self.menu_selectors:
+        for selector_group in self._selector_groups:
             try:
-                elements = page.query_selector_all(selector)
-                
-                for element in elements[:25]:  # Limit to prevent overload
-                    try:
-                        item = self._extract_item_from_element(element, 'css_selector')
-                        if item:
-                            items.append(item)
-                    except Exception:
-                        continue
+                elements = page.query_selector_all(selector_group)[:200]  # Limit to prevent overload
                 
-                if len(items) >= 15:  # Stop if we have enough
-                    break
+                # Read element text in batches, then analyze the raw strings
+                for start in range(0, len(elements), 25):
+                    texts = []
+                    for element in elements[start:start + 25]:
+                        try:
+                            text = element.inner_text().strip()
+                            if text and len(text) >= 3:
+                                texts.append(text)
+                        except Exception:
+                            continue
+                    
+                    items.extend(self._analyze_texts(texts, 'css_selector'))
+                    
+                    if len(items) >= 15:  # Stop if we have enough
+                        return items
                     
             except Exception:
                 continue
@@ -411,12 +427,10 @@ class EnhancedMenuScraper:
             page_text = page.inner_text('body')
             lines = [line.strip() for line in page_text.split('\n') if line.strip()]
             
-            # Look for lines with prices
-            price_pattern = re.compile(r'\$\d+(?:\.\d{2})?')
-            
-            for i, line in enumerate(lines):
-                if price_pattern.search(line) and len(line) > 5 and len(line) < 200:
-                    # Try to extract menu item from this line
+            # Look for lines with prices, analysing them in page order and
+            # stopping at the 10th item so long menus cost no extra analysis
+            for line in lines:
+                if 5 < len(line) < 200 and self._dollar_price_re.search(line):
                     item = self._extract_item_from_text(line, 'text_pattern')
                     if item:
                         items.append(item)
@@ -454,17 +468,10 @@ class EnhancedMenuScraper:
         
         return items
     
-    def _extract_item_from_element(self, element, method: str) -> Optional[EnhancedMenuItem]:
-        """Extract menu item from DOM element"""
-        try:
-            text = element.inner_text().strip()
-            if not text or len(text) < 3:
-                return None
-            
-            return self._extract_item_from_text(text, method)
-            
-        except Exception:
-            return None
+    def _analyze_texts(self, texts: List[str], method: str) -> List[EnhancedMenuItem]:
+        """Run item extraction over raw texts in order, dropping non-items"""
+        results = [self._extract_item_from_text(text, method) for text in texts]
+        return [item for item in results if item]
     
     def _extract_item_from_text(self, text: str, method: str) -> Optional[EnhancedMenuItem]:
         """Extract menu item from text with allergen detection"""
@@ -495,17 +502,17 @@ class EnhancedMenuScraper:
             if len(name) < 2:
                 return None
             
-            # Enhanced analysis
-            full_text = f"{name} {description}"
+            # Enhanced analysis (lowercase once, shared by every detector)
+            full_text_lower = f"{name} {description}".lower()
             
             # Detect allergens
-            allergens, allergen_confidence = self.allergen_detector.detect_allergens(full_text)
+            allergens, allergen_confidence = self.allergen_detector.detect_allergens(full_text_lower)
             
             # Detect dietary tags
-            dietary_tags = self.allergen_detector.detect_dietary_tags(full_text)
+            dietary_tags = self.allergen_detector.detect_dietary_tags(full_text_lower)
             
             # Categorize item
-            category = self._categorize_menu_item(name, description)
+            category = self._categorize_menu_item(full_text_lower)
             
             # Calculate confidence
             confidence_score = self._calculate_confidence(name, description, price, allergens, dietary_tags)
@@ -527,19 +534,24 @@ class EnhancedMenuScraper:
     
     def _extract_price_from_text(self, text: str) -> Optional[str]:
         """Extract price from text"""
-        for pattern in self.price_patterns:
-            match = re.search(pattern, text)
-            if match:
-                price = match.group()
-                if not price.startswith('$'):
-                    price = f'${price}'
-                return price
-        return None
-    
-    def _categorize_menu_item(self, name: str, description: str) -> str:
-        """Categorize menu item based on keywords"""
-        text = f"{name} {description}".lower()
+        match = self._price_re.search(text)
+        if not match:
+            return None
         
+        # Earlier patterns win even when they match further along the text
+        for pattern in self._price_pattern_res[:match.lastindex - 1]:
+            preferred = pattern.search(text, match.start())
+            if preferred:
+                match = preferred
+                break
+        
+        price = match.group()
+        if not price.startswith('$'):
+            price = f'${price}'
+        return price
+    
+    def _categorize_menu_item(self, text: str) -> str:
+        """Categorize menu item based on keywords in lowercased name + description"""
         category_keywords = {
             'appetizer': ['appetizer', 'starter', 'small plate', 'shareables', 'apps', 'dip', 'wings'],
             'salad': ['salad', 'greens', 'caesar', 'garden', 'mixed greens'],
@@ -618,16 +630,16 @@ class EnhancedMenuScraper:
             return False
         
         # Skip very short names
-        if len(item.name.strip()) < 3:
+        name = item.name.strip()
+        if len(name) < 3:
             return False
         
         # Skip navigation items
-        nav_words = ['home', 'about', 'contact', 'menu', 'location', 'hours', 'order online']
-        if any(word in item.name.lower() for word in nav_words):
+        if self._nav_re.search(name):
             return False
         
         # Skip items that are just prices
-        if re.match(r'^\$?\d+(?:\.\d{2})?$', item.name.strip()):
+        if self._price_only_re.match(name):
             return False
         
         return True
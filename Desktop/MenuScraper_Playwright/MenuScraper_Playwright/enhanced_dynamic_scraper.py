@@ -13,6 +13,7 @@ Key Improvements:
 """
 
 import asyncio
+import bisect
 import json
 import re
 import time
@@ -27,14 +28,73 @@ except ImportError:
     print("❌ Playwright not installed. Run: pip install playwright")
     exit(1)
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
 class EnhancedDynamicScraper:
     """Enhanced menu scraper with dynamic content handling and improved selectors"""
     
-    def __init__(self, headless: bool = True, timeout: int = 30000):
+    # Standalone patterns shared by every instance
+    _TRAILING_PARENS_RE = re.compile(r'\s*\([^)]*\)\s*$')
+    _NON_WORD_RE = re.compile(r'\W+')
+    
+    # Requests nothing in the scraper consumes; aborting them lets
+    # 'networkidle' fire well before the page's media finishes downloading.
+    # Stylesheets are kept because innerText depends on computed styles.
+    BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+    _TRACKER_HOST_RE = re.compile(
+        r'^https?://[^/]*(?:google-analytics\.com|googletagmanager\.com|doubleclick\.net|'
+        r'connect\.facebook\.net|hotjar\.com|segment\.io)[/:]'
+    )
+    
+    # Elements that innerText sets on their own lines; everything else
+    # (span, b, a, ...) is inline and its text joins its neighbours'
+    _BLOCK_TAGS = frozenset({
+        'address', 'article', 'aside', 'blockquote', 'caption', 'dd', 'details', 'dialog', 'div',
+        'dl', 'dt', 'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4',
+        'h5', 'h6', 'header', 'hgroup', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section',
+        'summary', 'table', 'tbody', 'tfoot', 'thead', 'tr', 'ul'
+    })
+    
+    # Page text beyond this many characters is noise for menu detection but
+    # still costs CDP serialization and a Python string copy
+    MAX_PAGE_TEXT = 500_000
+    
+    # Link texts that are certainly menu links, and href fragments that
+    # usually lead to one
+    MENU_LINK_EXACT_TEXTS = ['menu', 'food menu', 'our menu', 'view menu', 'order online']
+    MENU_URL_PATTERNS = ['/menu', '/food', '/order', '/delivery']
+    
+    # Stealth/performance flags for every Chromium launch
+    LAUNCH_ARGS = [
+        '--no-sandbox',
+        '--disable-blink-features=AutomationControlled',
+        '--disable-dev-shm-usage',
+        '--disable-extensions',
+        '--disable-gpu',
+        '--disable-web-security',
+        '--disable-features=VizDisplayCompositor',
+        '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    ]
+    
+    def __init__(self, headless: bool = True, timeout: int = 30000, block_resources: bool = True,
+                 user_data_dir: Optional[str] = None):
         self.headless = headless
         self.timeout = timeout
+        self.block_resources = block_resources
+        # Profile directory for a persistent context; its disk cache of CDN
+        # assets then survives across restaurants and runs. Only used with
+        # block_resources=False: Chromium bypasses its HTTP cache for routed
+        # contexts, so with blocking on the profile would cache nothing
+        self.user_data_dir = user_data_dir
         self.browser = None
         self.context = None
+        self._reusable_page = None
+        # Created on first use so it binds to the loop that runs the scrapes
+        self._reusable_page_lock = None
         
         # Enhanced allergen detection patterns
         self.allergen_patterns = {
@@ -85,67 +145,63 @@ class EnhancedDynamicScraper:
             'healthy': r'\b(?:healthy|light|low[\s-]?cal|nutritious|superfood)\b'
         }
         
-        # Comprehensive CSS selectors for modern websites
+        # Comprehensive CSS selectors for modern websites. Overlapping patterns
+        # are comma-grouped so the browser matches each group in one tree walk;
+        # groups are tried in order and the first one yielding items wins
         self.enhanced_selectors = [
             # Modern React/Vue component patterns
-            '[data-testid*="menu-item"]',
-            '[data-testid*="food-item"]',
-            '[data-testid*="dish"]',
-            '[data-testid*="product"]',
-            '[data-cy*="menu"]',
-            '[data-cy*="item"]',
+            '[data-testid*="menu-item"], [data-testid*="food-item"], [data-testid*="dish"], '
+            '[data-testid*="product"], [data-cy*="menu"], [data-cy*="item"]',
             
             # Class-based patterns (common naming conventions)
-            '[class*="MenuItem"]',
-            '[class*="FoodItem"]',
-            '[class*="DishItem"]',
-            '[class*="ProductCard"]',
-            '[class*="menu-item"]',
-            '[class*="food-item"]',
-            '[class*="dish-item"]',
-            '[class*="product-item"]',
+            '[class*="MenuItem"], [class*="FoodItem"], [class*="DishItem"], [class*="ProductCard"], '
+            '[class*="menu-item"], [class*="food-item"], [class*="dish-item"], [class*="product-item"]',
             
             # Menu container patterns
-            '[class*="menu"] [class*="item"]',
-            '[class*="food"] [class*="item"]',
-            '[class*="dish"] [class*="container"]',
-            '[class*="product"] [class*="card"]',
+            '[class*="menu"] [class*="item"], [class*="food"] [class*="item"], '
+            '[class*="dish"] [class*="container"], [class*="product"] [class*="card"]',
             
             # Price-based detection (enhanced) - using text content instead of has-text
-            '[class*="price"]',
-            '[data-testid*="price"]',
-            '.price, .cost, .amount',
-            'span[class*="dollar"]',
-            'div[class*="pricing"]',
+            '[class*="price"], [data-testid*="price"], .price, .cost, .amount, '
+            'span[class*="dollar"], div[class*="pricing"]',
             
             # List and grid patterns
-            'ul[class*="menu"] li',
-            'ol[class*="menu"] li',
-            'div[class*="grid"] > div',
-            'div[class*="list"] > div',
+            'ul[class*="menu"] li, ol[class*="menu"] li, div[class*="grid"] > div, div[class*="list"] > div',
             
-            # Table patterns
-            'table[class*="menu"] tr',
-            'tbody tr',
+            # Table patterns (covers table[class*="menu"] tr and tbody tr)
             'table tr',
             
             # Card patterns
-            '[class*="card"]',
-            '[class*="tile"]',
-            '[class*="panel"]',
+            '[class*="card"], [class*="tile"], [class*="panel"]',
             
             # Semantic HTML patterns
-            'article[class*="menu"]',
-            'section[class*="food"]',
-            'div[role="listitem"]',
+            'article[class*="menu"], section[class*="food"], div[role="listitem"]',
             
-            # Generic fallbacks
-            '.menu-item, .food-item, .dish-item, .product-item',
+            # Generic fallbacks (.menu-item etc. are covered by the class patterns above)
             '.item, .dish, .product',
             'li',
             'div:not([class*="price"]):not([class*="total"])'
         ]
         
+        # Component-level groups used to score whether a page holds a menu
+        self.menu_content_selectors = self.enhanced_selectors[:2]
+        
+        # Yelp-specific selectors, tried before the generic ones on Yelp pages
+        self.yelp_selectors = [
+            '[data-testid*="menu"], [data-testid*="food"], [data-testid*="item"]',
+            '[class*="menuItem"], [class*="food-item"], [class*="dish-name"]',
+            'div[class*="arrange"] div[class*="border"]',
+            'section[aria-label*="menu"] div',
+            'ul[class*="menu"] li',
+        ]
+        
+        # Selector chains keyed by is_yelp, built once instead of per page
+        # (dict.fromkeys drops exact duplicates while keeping order)
+        self._selector_chains = {
+            False: list(dict.fromkeys(self.enhanced_selectors)),
+            True: list(dict.fromkeys(self.yelp_selectors + self.enhanced_selectors))
+        }
+        
         # Dynamic content waiting strategies
         self.wait_strategies = [
             # Wait for menu containers
@@ -158,6 +214,14 @@ class EnhancedDynamicScraper:
             "document.querySelectorAll('*').length > 50 && document.body.innerText.length > 1000"
         ]
         
+        # Yelp pages render their menu late, behind data-testid components
+        self.yelp_wait_strategies = [
+            "document.querySelectorAll('[data-testid]').length > 10",
+            "document.querySelectorAll('[class*=\"menu\"]').length > 0",
+            "document.body.innerText.includes('Menu') || document.body.innerText.includes('$')",
+            "document.querySelectorAll('*').length > 200"
+        ]
+        
         # Menu link detection patterns
         self.menu_link_patterns = [
             r'\bmenu\b',
@@ -179,39 +243,123 @@ class EnhancedDynamicScraper:
             r'\$([0-9]+)\s*-\s*\$([0-9]+)',  # Price range $X-$Y
             r'([0-9]+)\s*-\s*([0-9]+)\s*\$',  # Range X-Y$
         ]
+        
+        # Words that mark a line of text as food-related
+        self.food_indicators = [
+            'served', 'grilled', 'fried', 'baked', 'fresh', 'homemade',
+            'sauce', 'cheese', 'chicken', 'beef', 'fish', 'pasta',
+            'salad', 'soup', 'sandwich', 'burger', 'pizza', 'rice',
+            'vegetables', 'meat', 'seafood', 'dessert', 'appetizer'
+        ]
+        
+        # Item categories in priority order (first matching category wins)
+        self.item_categories = {
+            'appetizer': ['appetizer', 'starter', 'small plate', 'sharing', 'wings', 'nachos'],
+            'salad': ['salad', 'greens', 'caesar', 'garden'],
+            'soup': ['soup', 'bisque', 'chowder', 'broth'],
+            'sandwich': ['sandwich', 'burger', 'wrap', 'panini', 'sub'],
+            'pasta': ['pasta', 'spaghetti', 'linguine', 'ravioli', 'lasagna'],
+            'pizza': ['pizza', 'flatbread', 'pie'],
+            'seafood': ['fish', 'salmon', 'tuna', 'shrimp', 'crab', 'lobster'],
+            'meat': ['steak', 'beef', 'chicken', 'pork', 'lamb', 'ribs'],
+            'dessert': ['dessert', 'cake', 'pie', 'ice cream', 'chocolate', 'cookie'],
+            'beverage': ['drink', 'soda', 'juice', 'coffee', 'tea', 'beer', 'wine']
+        }
+        
+        # Words whose presence on a page suggests it shows a menu
+        self.menu_indicators = [
+            'menu', 'food', 'dish', 'appetizer', 'entree', 'dessert',
+            'price', '$', 'order', 'cuisine', 'restaurant', 'delivery',
+            'takeout', 'dine', 'eat', 'meal', 'lunch', 'dinner', 'breakfast'
+        ]
+        
+        # Compiled counterparts of the pattern tables above, built once so the
+        # per-item hot paths never re-parse a pattern string
+        self._allergen_res = {
+            allergen: re.compile('|'.join(patterns), re.IGNORECASE)
+            for allergen, patterns in self.allergen_patterns.items()
+        }
+        self._dietary_res = {
+            tag: re.compile(pattern, re.IGNORECASE)
+            for tag, pattern in self.dietary_patterns.items()
+        }
+        
+        # Master alternations with one named group per allergen/tag, so a
+        # single finditer pass reports every group via match.lastgroup. The
+        # lookahead keeps matches zero-width, so a long keyword of one group
+        # never swallows a shorter keyword of another that starts inside it
+        self._allergen_master = re.compile(
+            '(?=' + '|'.join(f'(?P<{allergen}>{"|".join(patterns)})' for allergen, patterns in self.allergen_patterns.items()) + ')',
+            re.IGNORECASE
+        )
+        self._dietary_master = re.compile(
+            '(?=' + '|'.join(f'(?P<{tag}>{pattern})' for tag, pattern in self.dietary_patterns.items()) + ')',
+            re.IGNORECASE
+        )
+        self._price_res = [re.compile(pattern) for pattern in self.enhanced_price_patterns]
+        # Any-price test in one scan; value extraction keeps the ordered list
+        # above because pattern precedence decides which capture is the price
+        self._any_price_re = re.compile('|'.join(f'(?:{pattern})' for pattern in self.enhanced_price_patterns))
+        self._description_res = [
+            re.compile(f'^([^$]+?)\\s*{pattern}') for pattern in self.enhanced_price_patterns
+        ]
+        
+        # Food keyword alternation, longest first. Indicators must start a
+        # word (so "price" no longer counts as "rice") but may be pluralized
+        self._food_indicator_re = re.compile(
+            r'\b(?:' + '|'.join(sorted(map(re.escape, self.food_indicators), key=len, reverse=True)) + ')',
+            re.IGNORECASE
+        )
+        
+        # One named group per category. Keywords match as substrings, like
+        # the `in` checks they replace, so compounds such as "cheeseburger"
+        # still categorize; the lookahead keeps overlapping keywords visible
+        self._category_names = list(self.item_categories)
+        self._category_ranks = {category: rank for rank, category in enumerate(self._category_names)}
+        self._category_re = re.compile(
+            '(?=' + '|'.join(
+                f'(?P<{category}>{"|".join(map(re.escape, keywords))})'
+                for category, keywords in self.item_categories.items()
+            ) + ')',
+            re.IGNORECASE
+        )
+        
+        # A line can only look like a menu item if it has a price (every price
+        # pattern needs a digit) or a food indicator, so this matches exactly
+        # the lines worth scoring, each in full
+        self._candidate_line_re = re.compile(
+            r'^[^\n]*?(?:\d|' + '|'.join(re.escape(word) for word in self.food_indicators) + r')[^\n]*',
+            re.MULTILINE | re.IGNORECASE
+        )
     
     async def setup_browser(self) -> bool:
         """Setup browser with enhanced stealth and performance features"""
         try:
             playwright = await async_playwright().start()
             
-            # Enhanced browser launch with stealth settings
-            self.browser = await playwright.chromium.launch(
-                headless=self.headless,
-                args=[
-                    '--no-sandbox',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--disable-extensions',
-                    '--disable-gpu',
-                    '--disable-web-security',
-                    '--disable-features=VizDisplayCompositor',
-                    '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                ]
-            )
-            
-            # Create context with realistic settings
-            self.context = await self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                locale='en-US',
-                timezone_id='America/New_York',
-                extra_http_headers={
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
-                }
-            )
+            if self.user_data_dir and self.block_resources:
+                print("⚠️ user_data_dir ignored: the profile cache is bypassed while block_resources=True")
+            
+            if self.user_data_dir and not self.block_resources:
+                # Persistent profile: the context owns the browser, which
+                # Playwright does not expose (context.browser is None)
+                self.context = await playwright.chromium.launch_persistent_context(
+                    self.user_data_dir,
+                    headless=self.headless,
+                    args=self.LAUNCH_ARGS,
+                    **self._context_options()
+                )
+                self.browser = self.context.browser
+            else:
+                # Enhanced browser launch with stealth settings
+                self.browser = await playwright.chromium.launch(
+                    headless=self.headless,
+                    args=self.LAUNCH_ARGS
+                )
+                
+                # Create context with realistic settings
+                self.context = await self.browser.new_context(**self._context_options())
+            await self._configure_context(self.context)
             
             return True
             
@@ -219,6 +367,33 @@ class EnhancedDynamicScraper:
             print(f"❌ Browser setup failed: {e}")
             return False
     
+    def _context_options(self) -> Dict[str, Any]:
+        """Realistic browser context settings shared by every context we create"""
+        return {
+            'viewport': {'width': 1920, 'height': 1080},
+            'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'locale': 'en-US',
+            'timezone_id': 'America/New_York',
+            'extra_http_headers': {
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Accept-Encoding': 'gzip, deflate, br',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
+            }
+        }
+    
+    async def _configure_context(self, context) -> None:
+        """Apply request routing to a freshly created browser context"""
+        if self.block_resources:
+            await context.route('**/*', self._route_request)
+    
+    async def _route_request(self, route) -> None:
+        """Abort images, fonts, media and tracker requests; let everything else through"""
+        request = route.request
+        if request.resource_type in self.BLOCKED_RESOURCE_TYPES or self._TRACKER_HOST_RE.match(request.url):
+            await route.abort()
+        else:
+            await route.continue_()
+    
     async def smart_navigate_enhanced(self, page: Page, url: str) -> bool:
         """Enhanced navigation with better dynamic content handling"""
         try:
@@ -263,90 +438,80 @@ class EnhancedDynamicScraper:
     async def _wait_for_dynamic_content(self, page: Page, is_yelp: bool = False) -> None:
         """Wait for dynamic content to load using multiple strategies with Yelp-specific handling"""
         try:
-            # Enhanced wait for Yelp pages
             if is_yelp:
-                # Wait for Yelp-specific elements
-                yelp_strategies = [
-                    "document.querySelectorAll('[data-testid]').length > 10",
-                    "document.querySelectorAll('[class*=\"menu\"]').length > 0",
-                    "document.body.innerText.includes('Menu') || document.body.innerText.includes('$')",
-                    "document.querySelectorAll('*').length > 200"
-                ]
-                
-                for strategy in yelp_strategies:
-                    try:
-                        await page.wait_for_function(strategy, timeout=15000)
-                        break
-                    except:
-                        continue
-                
-                # Enhanced scrolling for Yelp lazy loading
-                await asyncio.sleep(2)
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await asyncio.sleep(2)
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight / 2)")
-                await asyncio.sleep(2)
-                await page.evaluate("window.scrollTo(0, 0)")
-                await asyncio.sleep(2)
+                # Yelp-specific readiness signals and slower lazy loading
+                strategies = self.yelp_wait_strategies
+                timeout = 15000
+                scroll_positions = ['document.body.scrollHeight', 'document.body.scrollHeight / 2', '0']
+                settle_ms = 1000
             else:
-                # Try multiple wait strategies for non-Yelp sites
-                for strategy in self.wait_strategies:
-                    try:
-                        await page.wait_for_function(
-                            strategy,
-                            timeout=10000
-                        )
-                        break  # If one succeeds, we're good
-                    except:
-                        continue
-                
-                # Additional wait for JavaScript execution
-                await asyncio.sleep(3)
-                
-                # Scroll to trigger lazy loading
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight / 2)")
-                await asyncio.sleep(1)
-                await page.evaluate("window.scrollTo(0, 0)")
-                await asyncio.sleep(1)
+                strategies = self.wait_strategies
+                timeout = 10000
+                scroll_positions = ['document.body.scrollHeight / 2', '0']
+                settle_ms = 500
+            
+            # One disjunctive condition: the earliest readiness signal wins,
+            # instead of waiting out each strategy's timeout in turn
+            try:
+                await page.wait_for_function(self._disjunction(strategies), timeout=timeout)
+            except Exception:
+                pass
+            
+            # Scroll to trigger lazy loading, letting each position settle
+            # in-page rather than sleeping a fixed time between round-trips.
+            # Plain setTimeout, not requestAnimationFrame, which never fires on
+            # background or hidden pages; the evaluate is bounded as well
+            steps = ''.join(
+                f'window.scrollTo(0, {position}); await settle();' for position in scroll_positions
+            )
+            try:
+                await asyncio.wait_for(
+                    page.evaluate(
+                        f"""async () => {{
+                            const settle = () => new Promise(resolve => setTimeout(resolve, {settle_ms}));
+                            {steps}
+                        }}"""
+                    ),
+                    timeout=timeout / 1000
+                )
+            except asyncio.TimeoutError:
+                pass
             
         except Exception as e:
             print(f"Dynamic content wait failed: {e}")
     
+    @staticmethod
+    def _disjunction(conditions: List[str]) -> str:
+        """Combine JS boolean expressions into one expression true when any is"""
+        return ' || '.join(f'({condition})' for condition in conditions)
+    
     async def _has_menu_content_enhanced(self, page: Page) -> bool:
         """Enhanced menu content detection"""
         try:
-            # Get page content
-            content = await page.content()
-            text_content = await page.evaluate("document.body.innerText")
-            
-            content_lower = content.lower()
-            text_lower = text_content.lower()
-            
-            # Enhanced menu indicators
-            menu_indicators = [
-                'menu', 'food', 'dish', 'appetizer', 'entree', 'dessert',
-                'price', '$', 'order', 'cuisine', 'restaurant', 'delivery',
-                'takeout', 'dine', 'eat', 'meal', 'lunch', 'dinner', 'breakfast'
-            ]
-            
-            # Count indicators in both HTML and text
-            html_score = sum(1 for indicator in menu_indicators if indicator in content_lower)
-            text_score = sum(1 for indicator in menu_indicators if indicator in text_lower)
-            
-            # Price pattern detection (enhanced)
-            price_patterns = len(re.findall(r'\$\d+(?:\.\d{2})?', text_content))
-            
-            # Menu-specific element detection
-            menu_elements = 0
-            for selector in self.enhanced_selectors[:10]:  # Check first 10 selectors
-                try:
-                    elements = await page.query_selector_all(selector)
-                    menu_elements += len(elements)
-                except:
-                    continue
-            
-            # Enhanced scoring algorithm
-            total_score = html_score + text_score + (price_patterns * 3) + (menu_elements * 2)
+            # Score the page in the browser so the page text never has to be
+            # copied into Python: 1 per distinct indicator in the visible
+            # text, 3 per price, 2 per element. innerText rather than
+            # textContent, so inline scripts, styles and JSON blobs cannot
+            # supply indicator hits such as 'eat' or 'order'
+            total_score = await page.evaluate(
+                """({sels, indicators, maxText}) => {
+                    const text = document.body.innerText.slice(0, maxText);
+                    const textLower = text.toLowerCase();
+                    let score = 0;
+                    for (const indicator of indicators) {
+                        if (textLower.includes(indicator)) score += 1;
+                    }
+                    score += (text.match(/\\$\\d+(?:\\.\\d{2})?/g) || []).length * 3;
+                    for (const sel of sels) {
+                        try {
+                            score += document.querySelectorAll(sel).length * 2;
+                        } catch (e) {}
+                    }
+                    return score;
+                }""",
+                {'sels': self.menu_content_selectors, 'indicators': self.menu_indicators,
+                 'maxText': self.MAX_PAGE_TEXT}
+            )
             
             return total_score >= 10
             
@@ -354,66 +519,69 @@ class EnhancedDynamicScraper:
             print(f"Menu content detection error: {e}")
             return False
     
-    async def _find_menu_links_enhanced(self, page: Page) -> List[Tuple]:
+    async def _find_menu_links_enhanced(self, page: Page, limit: int = 3) -> List[Tuple]:
         """Enhanced menu link detection with better scoring"""
         menu_links = []
         
         try:
-            # Get all links
-            links = await page.query_selector_all('a')
-            
-            for link in links:
-                try:
-                    # Get link text and href
-                    text = await link.inner_text()
-                    href = await link.get_attribute('href')
-                    
-                    if not text or not href:
-                        continue
-                    
-                    text_lower = text.lower().strip()
-                    href_lower = href.lower()
-                    
-                    # Enhanced relevance scoring
-                    relevance_score = 0
-                    
-                    # Exact matches get highest scores
-                    exact_matches = ['menu', 'food menu', 'our menu', 'view menu', 'order online']
-                    if text_lower in exact_matches:
-                        relevance_score += 10
-                    
-                    # Pattern-based scoring
-                    for pattern in self.menu_link_patterns:
-                        if re.search(pattern, text_lower):
-                            relevance_score += 3
-                        if re.search(pattern, href_lower):
-                            relevance_score += 2
-                    
-                    # Bonus for common menu URL patterns
-                    menu_url_patterns = ['/menu', '/food', '/order', '/delivery']
-                    for url_pattern in menu_url_patterns:
-                        if url_pattern in href_lower:
-                            relevance_score += 4
-                    
-                    # Add to candidates if relevant
-                    if relevance_score >= 3:
-                        menu_links.append((link, relevance_score, text))
+            # Score every link in the page and return only the best `limit`:
+            # 10 for an exact menu text, 3/2 per link pattern in the text/href,
+            # 4 per menu URL fragment. The sort is stable, so ties keep
+            # document order; a link repeated in header and footer keeps only
+            # its best-scoring entry so the top `limit` are distinct targets
+            ranked = await page.evaluate(
+                """({patterns, exact, urlPatterns, limit}) => {
+                    const regexes = patterns.map(p => new RegExp(p));
+                    const ranked = [];
+                    for (const a of document.querySelectorAll('a')) {
+                        const text = a.innerText;
+                        const href = a.getAttribute('href');
+                        if (!text || !href) continue;
                         
-                except Exception:
-                    continue
+                        const textLower = text.toLowerCase().trim();
+                        const hrefLower = href.toLowerCase();
+                        let score = exact.includes(textLower) ? 10 : 0;
+                        for (const re of regexes) {
+                            if (re.test(textLower)) score += 3;
+                            if (re.test(hrefLower)) score += 2;
+                        }
+                        for (const fragment of urlPatterns) {
+                            if (hrefLower.includes(fragment)) score += 4;
+                        }
+                        if (score >= 3) ranked.push({text, href, score});
+                    }
+                    ranked.sort((x, y) => y.score - x.score);
+                    const seen = new Set();
+                    return ranked.filter(link => {
+                        if (seen.has(link.href)) return false;
+                        seen.add(link.href);
+                        return true;
+                    }).slice(0, limit);
+                }""",
+                {
+                    'patterns': self.menu_link_patterns,
+                    'exact': self.MENU_LINK_EXACT_TEXTS,
+                    'urlPatterns': self.MENU_URL_PATTERNS,
+                    'limit': limit
+                }
+            )
+            
+            # The locator is only resolved against the page when clicked, to
+            # the first visible anchor with that href (e.g. not a collapsed
+            # mobile-nav copy)
+            for link_info in ranked:
+                href_selector = link_info['href'].replace('\\', '\\\\').replace('"', '\\"')
+                link = page.locator(f'a[href="{href_selector}"]:visible').first
+                menu_links.append((link, link_info['score'], link_info['text']))
             
-            # Sort by relevance score
-            menu_links.sort(key=lambda x: x[1], reverse=True)
             return menu_links
             
         except Exception:
             return []
     
-    async def _find_restaurant_website(self, restaurant_name: str) -> Optional[str]:
+    async def _find_restaurant_website(self, restaurant_name: str, page: Page) -> Optional[str]:
         """Find restaurant's official website using Google search"""
         try:
-            page = await self.context.new_page()
-            
             # Search for restaurant's official website
             search_query = f"{restaurant_name} restaurant official website"
             google_url = f"https://www.google.com/search?q={search_query.replace(' ', '+')}"
@@ -428,12 +596,10 @@ class EnhancedDynamicScraper:
                 try:
                     href = await result.get_attribute('href')
                     if href and self._is_likely_restaurant_website(href, restaurant_name):
-                        await page.close()
                         return href
                 except:
                     continue
             
-            await page.close()
             return None
             
         except Exception as e:
@@ -465,11 +631,18 @@ class EnhancedDynamicScraper:
         
         return False
     
-    async def _scrape_single_url(self, url: str, is_yelp: bool = False) -> List[Dict[str, Any]]:
+    async def _get_reusable_page(self) -> Page:
+        """Return the page shared by sequential scrapes, opening it on first use
+        
+        Only call this while holding _reusable_page_lock.
+        """
+        if self._reusable_page is None or self._reusable_page.is_closed():
+            self._reusable_page = await self.context.new_page()
+        return self._reusable_page
+    
+    async def _scrape_single_url(self, url: str, is_yelp: bool = False, page: Page = None) -> List[Dict[str, Any]]:
         """Scrape menu items from a single URL with enhanced strategies"""
         try:
-            page = await self.context.new_page()
-            
             # Navigate with appropriate handling
             await page.goto(url, wait_until='networkidle', timeout=self.timeout)
             
@@ -479,15 +652,33 @@ class EnhancedDynamicScraper:
             # Enhanced menu extraction
             menu_items = await self.extract_menu_enhanced(page, is_yelp)
             
-            await page.close()
+            # Park the page on a blank document so the site's scripts stop
+            # running, while the page itself stays open for the next URL
+            await page.goto('about:blank')
             return menu_items
             
         except Exception as e:
             print(f"Single URL scraping error for {url}: {e}")
             return []
     
-    async def extract_menu_items(self, url: str, restaurant_name: str = "") -> Dict[str, Any]:
-        """Main extraction method with official website fallback"""
+    async def extract_menu_items(self, url: str, restaurant_name: str = "", page: Page = None) -> Dict[str, Any]:
+        """Main extraction method with official website fallback
+        
+        All navigation happens on `page` when given, otherwise on a single
+        page that is reused across calls instead of opening one per URL.
+        Calls without a page take turns on it, so concurrent scrapes never
+        navigate the shared tab under each other.
+        """
+        if page is not None:
+            return await self._extract_menu_items(url, restaurant_name, page)
+        
+        if self._reusable_page_lock is None:
+            self._reusable_page_lock = asyncio.Lock()
+        async with self._reusable_page_lock:
+            return await self._extract_menu_items(url, restaurant_name, None)
+    
+    async def _extract_menu_items(self, url: str, restaurant_name: str, page: Optional[Page]) -> Dict[str, Any]:
+        """extract_menu_items() body; a None page means the shared reusable page"""
         start_time = time.time()
         
         result = {
@@ -503,12 +694,15 @@ class EnhancedDynamicScraper:
         }
         
         try:
+            if page is None:
+                page = await self._get_reusable_page()
+            
             # Determine if primary URL is Yelp
             is_yelp = 'yelp.com' in url.lower()
             
             # Step 1: Try scraping the primary URL (e.g., Yelp)
             print(f"🔍 Scraping primary URL: {url}")
-            primary_items = await self._scrape_single_url(url, is_yelp)
+            primary_items = await self._scrape_single_url(url, is_yelp, page)
             
             # Check if primary scraping was sufficient
             if len(primary_items) >= 5:  # Sufficient items found
@@ -524,13 +718,13 @@ class EnhancedDynamicScraper:
                 
                 # Step 2: Find and scrape official website
                 if restaurant_name:
-                    official_website = await self._find_restaurant_website(restaurant_name)
+                    official_website = await self._find_restaurant_website(restaurant_name, page)
                     
                     if official_website:
                         print(f"🔍 Found official website: {official_website}")
                         result['fallback_url'] = official_website
                         
-                        fallback_items = await self._scrape_single_url(official_website, False)
+                        fallback_items = await self._scrape_single_url(official_website, False, page)
                         
                         # Combine results, prioritizing fallback if better
                         if len(fallback_items) > len(primary_items):
@@ -608,7 +802,7 @@ class EnhancedDynamicScraper:
             
             # Remove duplicates and enhance items
             unique_items = self._remove_duplicates(all_items)
-            enhanced_items = [self._enhance_menu_item(item) for item in unique_items]
+            enhanced_items = self._enhance_menu_items(unique_items)
             
             return enhanced_items
             
@@ -620,57 +814,66 @@ class EnhancedDynamicScraper:
         """Extract menu items using enhanced CSS selectors with Yelp-specific patterns"""
         items = []
         
-        # Add Yelp-specific selectors if needed
-        selectors_to_use = self.enhanced_selectors.copy()
-        if is_yelp:
-            yelp_selectors = [
-                '[data-testid*="menu"]',
-                '[data-testid*="food"]',
-                '[data-testid*="item"]',
-                '[class*="menuItem"]',
-                '[class*="food-item"]',
-                '[class*="dish-name"]',
-                'div[class*="arrange"] div[class*="border"]',
-                'section[aria-label*="menu"] div',
-                'ul[class*="menu"] li',
-            ]
-            selectors_to_use = yelp_selectors + selectors_to_use
+        selectors_to_use = self._selector_chains[is_yelp]
         
-        for selector in selectors_to_use:
+        # Run the selector chain in the page: each call returns the texts of
+        # the first selector (from `start`) with non-trivial matches, and we
+        # only resume the chain if none of those texts parsed into items
+        start = 0
+        while start < len(selectors_to_use) and not items:
             try:
-                elements = await page.query_selector_all(selector)
-                
-                for element in elements:
-                    try:
-                        text = await element.inner_text()
-                        if text and len(text.strip()) > 3:
-                            item = self._parse_menu_item_text(text.strip(), is_yelp)
-                            if item:
-                                item['extraction_method'] = 'enhanced_css_selectors'
-                                item['selector_used'] = selector
-                                items.append(item)
-                    except:
-                        continue
-                        
-                if items:
-                    break  # If we found items with this selector, use them
-                    
-            except Exception as e:
-                continue
+                found = await page.evaluate(
+                    """(sels) => {
+                        for (let i = 0; i < sels.length; i++) {
+                            let elements;
+                            try {
+                                elements = document.querySelectorAll(sels[i]);
+                            } catch (e) {
+                                continue;
+                            }
+                            const texts = Array.from(elements, e => e.innerText);
+                            if (texts.some(t => t && t.trim().length > 3)) {
+                                return {index: i, texts: texts};
+                            }
+                        }
+                        return null;
+                    }""",
+                    selectors_to_use[start:]
+                )
+            except Exception:
+                break
+            
+            if not found:
+                break
+            
+            selector = selectors_to_use[start + found['index']]
+            for text in found['texts']:
+                if text and len(text.strip()) > 3:
+                    item = self._parse_menu_item_text(text.strip(), is_yelp)
+                    if item:
+                        item['extraction_method'] = 'enhanced_css_selectors'
+                        item['selector_used'] = selector
+                        items.append(item)
+            
+            start += found['index'] + 1
         
         return items
     
     async def _extract_with_text_analysis(self, page: Page, is_yelp: bool = False) -> List[Dict[str, Any]]:
         """Extract menu items using enhanced text analysis with improved price detection"""
         try:
-            # Get all text content
-            text_content = await page.evaluate("document.body.innerText")
+            # Get the rendered text; innerText keeps the line structure the
+            # candidate-line regex relies on, so only the length is capped here
+            text_content = await page.evaluate(
+                "(maxText) => document.body.innerText.slice(0, maxText)", self.MAX_PAGE_TEXT
+            )
             
             items = []
-            lines = text_content.split('\n')
             
-            for line in lines:
-                line = line.strip()
+            # One regex pass yields only the lines that could qualify, instead
+            # of splitting the whole page and scoring every line in Python
+            for match in self._candidate_line_re.finditer(text_content):
+                line = match.group().strip()
                 if len(line) < 5 or len(line) > 300:
                     continue
                 
@@ -690,9 +893,6 @@ class EnhancedDynamicScraper:
     async def _extract_with_price_detection(self, page: Page, is_yelp: bool = False) -> List[Dict[str, Any]]:
         """Extract menu items by detecting enhanced price patterns"""
         try:
-            # Get all text content and find elements with price patterns
-            text_content = await page.evaluate("document.body.innerText")
-            
             # Enhanced price selectors with Yelp-specific patterns
             price_selectors = [
                 '[class*="price"]',
@@ -714,22 +914,30 @@ class EnhancedDynamicScraper:
                 ]
                 price_selectors = yelp_price_selectors + price_selectors
             
+            if SELECTOLAX_AVAILABLE:
+                # Snapshot the DOM once and run the broad span/div/p sweep offline
+                texts_by_selector = await self._select_texts_offline(page, price_selectors)
+            else:
+                # Read the text of every element for every selector in a single round-trip
+                texts_by_selector = await page.evaluate(
+                    """(sels) => sels.map(sel => {
+                        try {
+                            return Array.from(document.querySelectorAll(sel), e => e.innerText);
+                        } catch (e) {
+                            return [];
+                        }
+                    })""",
+                    price_selectors
+                )
+            
             items = []
-            for selector in price_selectors:
-                try:
-                    elements = await page.query_selector_all(selector)
-                    for element in elements:
-                        try:
-                            text = await element.inner_text()
-                            if text and self._has_enhanced_price_pattern(text) and len(text.strip()) > 3:
-                                item = self._parse_menu_item_text(text.strip(), is_yelp)
-                                if item:
-                                    item['extraction_method'] = 'enhanced_price_detection'
-                                    items.append(item)
-                        except:
-                            continue
-                except:
-                    continue
+            for texts in texts_by_selector:
+                for text in texts:
+                    if text and self._has_enhanced_price_pattern(text) and len(text.strip()) > 3:
+                        item = self._parse_menu_item_text(text.strip(), is_yelp)
+                        if item:
+                            item['extraction_method'] = 'enhanced_price_detection'
+                            items.append(item)
             
             return items
             
@@ -737,26 +945,64 @@ class EnhancedDynamicScraper:
             print(f"Enhanced price detection error: {e}")
             return []
     
+    async def _select_texts_offline(self, page: Page, selectors: List[str]) -> List[List[str]]:
+        """Parse one page.content() snapshot with selectolax and collect each
+        match's innerText-like text per selector"""
+        tree = LexborHTMLParser(await page.content())
+        tree.strip_tags(['script', 'style', 'noscript', 'template'])
+        
+        texts_by_selector = []
+        for selector in selectors:
+            try:
+                nodes = tree.css(selector)
+            except Exception:
+                nodes = []
+            texts_by_selector.append([self._node_inner_text(node) for node in nodes])
+        return texts_by_selector
+    
+    @classmethod
+    def _node_inner_text(cls, node) -> str:
+        """Approximate innerText for a selectolax node: inline text runs are
+        joined, block elements and <br> start new lines, table cells are
+        space-separated and whitespace within a line is collapsed"""
+        parts = []
+        # Explicit stack (children pushed in reverse) so deep DOMs cannot
+        # hit the recursion limit; str entries are separators to emit
+        stack = list(node.iter(include_text=True))[::-1]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                parts.append(item)
+                continue
+            
+            tag = item.tag
+            if tag == '-text':
+                parts.append(item.text(deep=False))
+            elif tag == 'br':
+                parts.append('\n')
+            elif tag.startswith('-'):
+                continue  # comments and other non-element nodes
+            elif tag in cls._BLOCK_TAGS:
+                stack.append('\n')
+                stack.extend(list(item.iter(include_text=True))[::-1])
+                stack.append('\n')
+            elif tag in ('td', 'th'):
+                stack.extend(list(item.iter(include_text=True))[::-1])
+                stack.append(' ')
+            else:
+                stack.extend(list(item.iter(include_text=True))[::-1])
+        
+        lines = (' '.join(line.split()) for line in ''.join(parts).split('\n'))
+        return '\n'.join(line for line in lines if line)
+    
     def _has_enhanced_price_pattern(self, text: str) -> bool:
         """Check if text contains enhanced price patterns"""
-        for pattern in self.enhanced_price_patterns:
-            if re.search(pattern, text):
-                return True
-        return False
+        return self._any_price_re.search(text) is not None
     
     def _is_likely_menu_item(self, text: str, is_yelp: bool = False) -> bool:
         """Enhanced menu item likelihood detection with Yelp-specific logic"""
-        text_lower = text.lower()
-        
         # Must have some food-related content
-        food_indicators = [
-            'served', 'grilled', 'fried', 'baked', 'fresh', 'homemade',
-            'sauce', 'cheese', 'chicken', 'beef', 'fish', 'pasta',
-            'salad', 'soup', 'sandwich', 'burger', 'pizza', 'rice',
-            'vegetables', 'meat', 'seafood', 'dessert', 'appetizer'
-        ]
-        
-        has_food_indicator = any(indicator in text_lower for indicator in food_indicators)
+        has_food_indicator = self._food_indicator_re.search(text) is not None
         has_price = self._has_enhanced_price_pattern(text)
         reasonable_length = 10 <= len(text) <= 200
         
@@ -778,8 +1024,8 @@ class EnhancedDynamicScraper:
         try:
             # Enhanced price extraction using multiple patterns
             price = None
-            for pattern in self.enhanced_price_patterns:
-                match = re.search(pattern, text)
+            for pattern in self._price_res:
+                match = pattern.search(text)
                 if match:
                     try:
                         # Handle different capture groups
@@ -792,18 +1038,18 @@ class EnhancedDynamicScraper:
             
             # Clean item name (remove price and common suffixes)
             name = text
-            for pattern in self.enhanced_price_patterns:
-                name = re.sub(pattern, '', name)
+            for pattern in self._price_res:
+                name = pattern.sub('', name)
             name = name.strip()
-            name = re.sub(r'\s*\([^)]*\)\s*$', '', name).strip()  # Remove trailing parentheses
+            name = self._TRAILING_PARENS_RE.sub('', name).strip()  # Remove trailing parentheses
             
             if len(name) < 3:
                 return None
             
             # Extract description (text after name, before price)
             description = None
-            for pattern in self.enhanced_price_patterns:
-                desc_match = re.search(f'^([^$]+?)\s*{pattern}', text)
+            for pattern in self._description_res:
+                desc_match = pattern.search(text)
                 if desc_match:
                     description = desc_match.group(1).strip()
                     break
@@ -827,72 +1073,91 @@ class EnhancedDynamicScraper:
     
     def _categorize_item(self, text: str) -> str:
         """Enhanced item categorization"""
-        text_lower = text.lower()
-        
-        categories = {
-            'appetizer': ['appetizer', 'starter', 'small plate', 'sharing', 'wings', 'nachos'],
-            'salad': ['salad', 'greens', 'caesar', 'garden'],
-            'soup': ['soup', 'bisque', 'chowder', 'broth'],
-            'sandwich': ['sandwich', 'burger', 'wrap', 'panini', 'sub'],
-            'pasta': ['pasta', 'spaghetti', 'linguine', 'ravioli', 'lasagna'],
-            'pizza': ['pizza', 'flatbread', 'pie'],
-            'seafood': ['fish', 'salmon', 'tuna', 'shrimp', 'crab', 'lobster'],
-            'meat': ['steak', 'beef', 'chicken', 'pork', 'lamb', 'ribs'],
-            'dessert': ['dessert', 'cake', 'pie', 'ice cream', 'chocolate', 'cookie'],
-            'beverage': ['drink', 'soda', 'juice', 'coffee', 'tea', 'beer', 'wine']
-        }
-        
-        for category, keywords in categories.items():
-            if any(keyword in text_lower for keyword in keywords):
-                return category
+        # Categories are listed in priority order, so keep the best-ranked
+        # category seen anywhere in the text rather than the leftmost one
+        best_rank = None
+        for match in self._category_re.finditer(text):
+            rank = self._category_ranks[match.lastgroup]
+            if best_rank is None or rank < best_rank:
+                best_rank = rank
+                if rank == 0:
+                    break
         
-        return 'other'
+        if best_rank is None:
+            return 'other'
+        return self._category_names[best_rank]
     
     def _enhance_menu_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """Enhance menu item with allergen detection and confidence scoring"""
-        text_for_analysis = f"{item.get('name', '')} {item.get('description', '')}".lower()
-        
-        # Detect allergens
-        allergens = self._detect_allergens(text_for_analysis)
+        return self._enhance_menu_items([item])[0]
+    
+    def _enhance_menu_items(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Enhance a batch of menu items with one allergen and one dietary scan"""
+        if not items:
+            return items
         
-        # Detect dietary tags
-        dietary_tags = self._detect_dietary_tags(text_for_analysis)
+        # Join every item's text into one blob so each master alternation runs
+        # once per page instead of once per item. NUL never occurs in page
+        # text and, like a string edge, is a \b boundary that no \s matches,
+        # so no keyword can straddle two items. The patterns are all
+        # IGNORECASE, so the blob is scanned as-is rather than lowercased
+        texts = [f"{item.get('name', '')} {item.get('description', '')}" for item in items]
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+        blob = '\0'.join(texts)
         
-        # Calculate confidence score
-        confidence = self._calculate_confidence_score(item)
+        # Detect allergens and dietary tags
+        allergens = self._match_groups_by_item(self._allergen_master, self._allergen_res, blob, starts)
+        dietary = self._match_groups_by_item(self._dietary_master, self._dietary_res, blob, starts)
         
-        # Enhance the item
-        item.update({
-            'allergens': allergens,
-            'dietary_tags': dietary_tags,
-            'confidence_score': confidence,
-            'has_price': item.get('price') is not None,
-            'has_description': item.get('description') is not None
-        })
+        for item, item_allergens, item_dietary in zip(items, allergens, dietary):
+            # Calculate confidence score
+            confidence = self._calculate_confidence_score(item)
+            
+            # Enhance the item
+            item.update({
+                'allergens': list(item_allergens),
+                'dietary_tags': [tag for tag in self.dietary_patterns if tag in item_dietary],
+                'confidence_score': confidence,
+                'has_price': item.get('price') is not None,
+                'has_description': item.get('description') is not None
+            })
         
-        return item
+        return items
     
     def _detect_allergens(self, text: str) -> List[str]:
         """Enhanced allergen detection"""
-        detected = []
-        
-        for allergen, patterns in self.allergen_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    detected.append(allergen)
-                    break
-        
-        return list(set(detected))
+        return list(self._match_groups(self._allergen_master, self._allergen_res, text))
     
     def _detect_dietary_tags(self, text: str) -> List[str]:
         """Enhanced dietary tag detection"""
-        detected = []
+        detected = self._match_groups(self._dietary_master, self._dietary_res, text)
+        return [tag for tag in self.dietary_patterns if tag in detected]
+    
+    def _match_groups(self, master: re.Pattern, group_res: Dict[str, re.Pattern], text: str) -> set:
+        """Collect the named groups of a master alternation that match anywhere in text"""
+        return self._match_groups_by_item(master, group_res, text, [0])[0]
+    
+    def _match_groups_by_item(self, master: re.Pattern, group_res: Dict[str, re.Pattern],
+                              blob: str, starts: List[int]) -> List[set]:
+        """Collect matching named groups per item of a blob whose items begin at `starts`"""
+        found = [set() for _ in starts]
         
-        for tag, pattern in self.dietary_patterns.items():
-            if re.search(pattern, text, re.IGNORECASE):
-                detected.append(tag)
+        for match in master.finditer(blob):
+            pos = match.start()
+            item_found = found[bisect.bisect_right(starts, pos) - 1]
+            item_found.add(match.lastgroup)
+            
+            # Keywords shared by several groups (e.g. "plant-based") match at the
+            # same offset, where the alternation only reports the first group
+            for key, pattern in group_res.items():
+                if key not in item_found and pattern.match(blob, pos):
+                    item_found.add(key)
         
-        return detected
+        return found
     
     def _calculate_confidence_score(self, item: Dict[str, Any]) -> float:
         """Enhanced confidence scoring"""
@@ -927,8 +1192,10 @@ class EnhancedDynamicScraper:
         unique_items = []
         
         for item in items:
-            # Create a key based on name and price
-            key = (item.get('name', '').lower().strip(), item.get('price'))
+            # Create a key based on normalized name and price, so names that
+            # differ only in case, spacing or punctuation count as duplicates
+            name_key = self._NON_WORD_RE.sub(' ', item.get('name', '').lower()).strip()
+            key = (name_key, item.get('price'))
             
             if key not in seen:
                 seen.add(key)
@@ -936,13 +1203,13 @@ class EnhancedDynamicScraper:
         
         return unique_items
     
-    async def scrape_restaurant_enhanced(self, restaurant_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def scrape_restaurant_enhanced(self, restaurant_data: Dict[str, Any], page: Page = None) -> Dict[str, Any]:
         """Enhanced restaurant scraping with fallback capabilities"""
         restaurant_name = restaurant_data.get('name', 'Unknown')
         url = restaurant_data.get('url', '')
         
         # Use the new extract_menu_items method with fallback logic
-        result = await self.extract_menu_items(url, restaurant_name)
+        result = await self.extract_menu_items(url, restaurant_name, page)
         
         # Ensure backward compatibility with expected result format
         if 'url' not in result:
@@ -950,6 +1217,37 @@ class EnhancedDynamicScraper:
         
         return result
     
+    async def scrape_many(self, restaurants: List[Dict[str, Any]], concurrency: int = 4) -> List[Dict[str, Any]]:
+        """Scrape several restaurants concurrently on the shared browser
+        
+        Each restaurant gets its own browser context (and one page in it) so
+        cookies and storage never leak between concurrent scrapes. With a
+        persistent profile there is no browser to open contexts on, so each
+        restaurant gets its own page in the shared persistent context instead.
+        Concurrency is capped at 8 to keep the browser from saturating the CPU.
+        Results keep input order.
+        """
+        semaphore = asyncio.Semaphore(max(1, min(concurrency, 8)))
+        
+        async def scrape_one(restaurant_data: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                if self.browser is None:
+                    page = await self.context.new_page()
+                    try:
+                        return await self.scrape_restaurant_enhanced(restaurant_data, page)
+                    finally:
+                        await page.close()
+                
+                context = await self.browser.new_context(**self._context_options())
+                try:
+                    await self._configure_context(context)
+                    page = await context.new_page()
+                    return await self.scrape_restaurant_enhanced(restaurant_data, page)
+                finally:
+                    await context.close()
+        
+        return await asyncio.gather(*(scrape_one(restaurant) for restaurant in restaurants))
+    
     async def cleanup(self):
         """Cleanup browser resources"""
         try:
@@ -959,6 +1257,9 @@ class EnhancedDynamicScraper:
                 await self.browser.close()
         except Exception as e:
             print(f"Cleanup error: {e}")
+        finally:
+            self._reusable_page = None
+            self._reusable_page_lock = None
 
 # Example usage
 if __name__ == "__main__":
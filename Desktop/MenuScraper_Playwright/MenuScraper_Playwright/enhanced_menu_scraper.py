@@ -4,14 +4,17 @@ Enhanced Menu Scraper - Phase 1 Implementation
 Targets 25-30% success rate improvement through enhanced detection and multi-source scraping
 """
 
+import asyncio
 import json
 import time
 import re
 from datetime import datetime
 import os
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import requests
-from playwright.sync_api import sync_playwright
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from playwright.async_api import async_playwright
 from urllib.parse import urljoin, urlparse, quote
 import easyocr
 import cv2
@@ -19,24 +22,601 @@ import numpy as np
 from PIL import Image
 import io
 import base64
+import bisect
+from itertools import islice
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, asdict
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+    # HTTP/2 needs the optional h2 package (httpx[http2])
+    try:
+        import h2
+        HTTP2_AVAILABLE = True
+    except ImportError:
+        HTTP2_AVAILABLE = False
+except ImportError:
+    HTTPX_AVAILABLE = False
+    HTTP2_AVAILABLE = False
+
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+try:
+    import onnxruntime
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+# Substrings that mark text as food-related, as non-menu boilerplate, and
+# as a potential allergen source
+FOOD_KEYWORDS = [
+    'chicken', 'beef', 'fish', 'pasta', 'salad', 'soup', 'pizza', 'burger',
+    'sandwich', 'steak', 'seafood', 'vegetarian', 'dessert', 'appetizer',
+    'entree', 'special', 'grilled', 'fried', 'baked', 'roasted', 'sauteed',
+    'served', 'with', 'sauce', 'cheese', 'bread', 'rice', 'noodles',
+    'shrimp', 'lobster', 'crab', 'salmon', 'tuna', 'pork', 'lamb',
+    'wings', 'ribs', 'tacos', 'burrito', 'quesadilla', 'nachos'
+]
+
+EXCLUDED_KEYWORDS = [
+    'copyright', 'privacy', 'terms', 'contact', 'address', 'phone',
+    'hours', 'location', 'directions', 'parking', 'website',
+    'follow us', 'social media', 'newsletter', 'subscribe'
+]
+
+ALLERGEN_KEYWORDS = {
+    'dairy': ['milk', 'cheese', 'butter', 'cream', 'yogurt', 'dairy'],
+    'eggs': ['egg', 'eggs', 'mayonnaise'],
+    'fish': ['fish', 'salmon', 'tuna', 'cod', 'halibut'],
+    'shellfish': ['shrimp', 'lobster', 'crab', 'oyster', 'mussel', 'clam'],
+    'tree_nuts': ['almond', 'walnut', 'pecan', 'cashew', 'pistachio'],
+    'peanuts': ['peanut', 'peanuts'],
+    'wheat': ['wheat', 'flour', 'bread', 'pasta', 'noodles'],
+    'soy': ['soy', 'tofu', 'soybean']
+}
+
+def _build_keyword_automaton():
+    """One automaton over every keyword list; each word maps to all the
+    (kind, category) labels it belongs to ("fish" is both food and allergen)"""
+    labels = {}
+    for keyword in FOOD_KEYWORDS:
+        labels.setdefault(keyword, []).append(('food', None))
+    for keyword in EXCLUDED_KEYWORDS:
+        labels.setdefault(keyword, []).append(('excluded', None))
+    for allergen, keywords in ALLERGEN_KEYWORDS.items():
+        for keyword in keywords:
+            labels.setdefault(keyword, []).append(('allergen', allergen))
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, keyword_labels in labels.items():
+        automaton.add_word(keyword, tuple(keyword_labels))
+    automaton.make_automaton()
+    return automaton
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton() if AHOCORASICK_AVAILABLE else None
+
+def _keyword_re(keywords):
+    """Case-insensitive substring match for any of `keywords`"""
+    return re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+
+# Without pyahocorasick, each keyword list is one alternation searched in
+# C, with IGNORECASE standing in for a lowercased copy of the text
+_FOOD_RE = _keyword_re(FOOD_KEYWORDS)
+_EXCLUDED_RE = _keyword_re(EXCLUDED_KEYWORDS)
+_ALLERGEN_RES = {allergen: _keyword_re(keywords) for allergen, keywords in ALLERGEN_KEYWORDS.items()}
+
+# Patterns are compiled once at import instead of going through re's
+# pattern cache on every call inside the per-item loops
+# Item price patterns, searched in order so a $-prefixed price wins over
+# a bare number elsewhere in the text (e.g. "Buffalo Wings 10 $14.99")
+_ITEM_PRICE_RES = [
+    re.compile(r'\$([0-9]+(?:\.[0-9]{2})?)', re.IGNORECASE),  # $12.99
+    re.compile(r'([0-9]+(?:\.[0-9]{2})?)\s*\$', re.IGNORECASE),  # 12.99 $
+    re.compile(r'\$\s*([0-9]+(?:\.[0-9]{2})?)', re.IGNORECASE),  # $ 12.99
+    re.compile(r'USD\s*([0-9]+(?:\.[0-9]{2})?)', re.IGNORECASE),  # USD 12.99
+    re.compile(r'([0-9]+)\s*dollars?', re.IGNORECASE),  # 12 dollars
+]
+
+# Enhanced price patterns with food context, most specific first
+_PAGE_PRICE_RES = [
+    re.compile(r'([A-Z][^$\n]{10,80}(?:chicken|beef|fish|pasta|salad|soup|pizza|burger|sandwich|steak|seafood|vegetarian|dessert|appetizer|entree|special)[^$\n]{0,30})\s*\$([0-9]+(?:\.[0-9]{2})?)', re.MULTILINE | re.IGNORECASE),
+    re.compile(r'([^$\n]{15,100})\s*\$([0-9]+(?:\.[0-9]{2})?)', re.MULTILINE | re.IGNORECASE),
+    re.compile(r'([A-Z][^\n]{20,80})\s*-\s*\$([0-9]+(?:\.[0-9]{2})?)', re.MULTILINE | re.IGNORECASE),
+    re.compile(r'([A-Z][^\n]{15,60})\s*\.{2,}\s*\$([0-9]+(?:\.[0-9]{2})?)', re.MULTILINE | re.IGNORECASE),
+]
+
+_DOLLAR_PRICE_RE = re.compile(r'\$([0-9]+(?:\.[0-9]{2})?)')
+
+# Phrases in reviews that name a dish
+_REVIEW_FOOD_RES = [
+    re.compile(r'I ordered the ([^.!?\n]{5,40})', re.IGNORECASE),
+    re.compile(r'The ([^.!?\n]{5,40}) was (?:delicious|amazing|great|good|excellent)', re.IGNORECASE),
+    re.compile(r'Try the ([^.!?\n]{5,40})', re.IGNORECASE),
+    re.compile(r'([A-Z][a-z]+ [A-Z][a-z]+) is (?:delicious|amazing|great|good)', re.IGNORECASE),
+    re.compile(r'([A-Z][^.!?\n]{10,40}) \$([0-9]+)', re.IGNORECASE),
+]
+
+@dataclass
+class MenuItem:
+    """One extracted menu item; results are turned into dicts only once a
+    scrape is finished"""
+    __slots__ = ('name', 'description', 'price', 'potential_allergens', 'source', 'confidence')
+    name: str
+    description: str
+    price: Optional[str]
+    potential_allergens: List[str]
+    source: str
+    confidence: str
+
+# Exported OCR models are cached here between runs
+ONNX_MODEL_DIR = os.path.join(os.path.expanduser('~'), '.menuscraper', 'onnx')
+
+class OnnxModel:
+    """Stands in for one of EasyOCR's torch models, running an exported
+    ONNX graph instead. EasyOCR calls its detector as net(x) -> (y, feature)
+    and its recognizer as model(image, text) -> preds (text is unused), with
+    torch tensors in and out, and keeps all pre/post-processing itself"""
+    
+    def __init__(self, model_path: str, providers: List[str]):
+        self.session = onnxruntime.InferenceSession(model_path, providers=providers)
+        self.input_name = self.session.get_inputs()[0].name
+    
+    def eval(self):
+        return self
+    
+    def __call__(self, x, *unused):
+        import torch
+        outputs = [
+            torch.from_numpy(output)
+            for output in self.session.run(None, {self.input_name: x.detach().cpu().numpy()})
+        ]
+        return tuple(outputs) if len(outputs) > 1 else outputs[0]
+
+def use_onnx_ocr_models(reader, model_dir: str = ONNX_MODEL_DIR) -> str:
+    """Swap an (unquantized) EasyOCR reader's detector and recognizer for
+    ONNX Runtime sessions, exporting the models on first use. Returns the
+    execution provider in use"""
+    import torch
+    
+    class RecognizerExport(torch.nn.Module):
+        def __init__(self, model):
+            super().__init__()
+            self.model = model
+        
+        def forward(self, image):
+            return self.model(image, None)
+    
+    # On the GPU EasyOCR wraps both models in DataParallel
+    detector = getattr(reader.detector, 'module', reader.detector)
+    recognizer = getattr(reader.recognizer, 'module', reader.recognizer)
+    device = next(detector.parameters()).device
+    
+    os.makedirs(model_dir, exist_ok=True)
+    detector_path = os.path.join(model_dir, 'craft.onnx')
+    recognizer_path = os.path.join(model_dir, 'recognizer_en.onnx')
+    exports = [
+        (detector, detector_path, torch.zeros(1, 3, 640, 640, device=device), ['y', 'feature'],
+         {'input': {0: 'N', 2: 'H', 3: 'W'}, 'y': {0: 'N', 1: 'H', 2: 'W'}, 'feature': {0: 'N', 2: 'H', 3: 'W'}}),
+        (RecognizerExport(recognizer), recognizer_path, torch.zeros(1, 1, 64, 256, device=device), ['preds'],
+         {'input': {0: 'N', 3: 'W'}, 'preds': {0: 'N', 1: 'T'}}),
+    ]
+    for model, path, dummy, output_names, dynamic_axes in exports:
+        if os.path.exists(path):
+            continue
+        # Export next to the target and swap it in, so a concurrent run
+        # never loads a half-written model
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with torch.no_grad():
+            torch.onnx.export(
+                model, dummy, tmp_path, opset_version=17,
+                input_names=['input'], output_names=output_names, dynamic_axes=dynamic_axes
+            )
+        os.replace(tmp_path, path)
+    
+    available = set(onnxruntime.get_available_providers())
+    providers = [
+        provider for provider in ('CUDAExecutionProvider', 'OpenVINOExecutionProvider', 'CPUExecutionProvider')
+        if provider in available
+    ]
+    reader.detector, reader.recognizer = OnnxModel(detector_path, providers), OnnxModel(recognizer_path, providers)
+    return providers[0]
+
+class BrowserPool:
+    """One lazily launched Chromium with a ring of reusable browser contexts
+    
+    Launching the browser costs seconds, so it happens once per batch rather
+    than once per restaurant. Pages are handed out by `acquire()`; a context
+    goes back on the ring when its page closes, so at most `pool_size`
+    pages are open at any time.
+    
+    With block_resources the contexts abort image, font and media requests.
+    Nothing here renders those (menu images for OCR are downloaded
+    separately from their src), and they dominate page weight and the
+    networkidle wait. Stylesheets still load, since visibility checks and
+    innerText depend on them.
+    """
+    
+    BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+    
+    def __init__(self, pool_size: int = 5, headless: bool = True, block_resources: bool = True):
+        self.pool_size = max(1, pool_size)
+        self.headless = headless
+        self.block_resources = block_resources
+        self._playwright = None
+        self._browser = None
+        self._contexts = None
+        self._all_contexts = []
+        self._lock = None
+    
+    async def _ensure_browser(self):
+        """Launch Chromium and pre-create the contexts on first use"""
+        # Created here, not in __init__, so the lock belongs to the running
+        # loop; close() drops it so a later asyncio.run() gets a fresh one
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._browser is not None:
+                return
+            
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            browser = await self._playwright.chromium.launch(
+                headless=self.headless,
+                args=['--disable-dev-shm-usage', '--no-sandbox']
+            )
+            contexts = asyncio.Queue()
+            try:
+                for _ in range(self.pool_size):
+                    context = await browser.new_context()
+                    self._all_contexts.append(context)
+                    if self.block_resources:
+                        await context.route('**/*', self._route_request)
+                    contexts.put_nowait(context)
+            except Exception:
+                await browser.close()
+                self._all_contexts = []
+                raise
+            
+            # Only publish the browser once every context exists
+            self._contexts = contexts
+            self._browser = browser
+    
+    async def _route_request(self, route):
+        """Abort images, fonts and media; let everything else through"""
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    @asynccontextmanager
+    async def acquire(self):
+        """Yield a fresh page in the next free context; on release the page is
+        closed and the site's cookies dropped, so the next restaurant in this
+        context starts clean"""
+        await self._ensure_browser()
+        contexts = self._contexts
+        context = await contexts.get()
+        page = None
+        try:
+            page = await context.new_page()
+            yield page
+        finally:
+            try:
+                if page is not None:
+                    try:
+                        await page.close()
+                    except Exception:
+                        pass
+                try:
+                    await context.clear_cookies()
+                except Exception:
+                    pass
+            finally:
+                # Always hand the context back, or later acquires would wait forever
+                contexts.put_nowait(context)
+    
+    async def close(self):
+        """Close every context, the browser and Playwright"""
+        try:
+            for context in self._all_contexts:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+            if self._browser is not None:
+                await self._browser.close()
+            if self._playwright is not None:
+                await self._playwright.stop()
+        finally:
+            self._playwright = None
+            self._browser = None
+            self._contexts = None
+            self._all_contexts = []
+            self._lock = None
 
 class EnhancedMenuScraper:
-    def __init__(self):
-        self.easyocr_reader = None
-        self.session = requests.Session()
+    # Selector lists in priority order. Each is walked inside the page in a
+    # single evaluate that stops at the first selector with a usable match,
+    # instead of one Playwright query per selector
+    MENU_LINK_SELECTORS = [
+        # Standard menu links
+        'a[href*="menu"]',
+        'a:has-text("Menu")',
+        'a:has-text("View Menu")',
+        'a:has-text("Our Menu")',
+        'a:has-text("Food Menu")',
+        'button:has-text("Menu")',
+        
+        # Data attributes
+        '[data-test*="menu"]',
+        '[data-menu]',
+        '[data-testid*="menu"]',
+        
+        # Class-based detection
+        '.menu-link',
+        '.view-menu',
+        '.menu-button',
+        
+        # Yelp-specific
+        'a[href*="/menu/"]',
+        '.menu-tab',
+        '.biz-menu-link'
+    ]
+    
+    STRUCTURED_SELECTORS = [
+        # Standard menu item patterns
+        '[class*="menu-item"]',
+        '[data-test*="menu-item"]',
+        '.menu-item',
+        '.dish',
+        '.food-item',
+        
+        # Food delivery patterns
+        '[class*="dish"]',
+        '[class*="food-item"]',
+        '.item-card',
+        '.product-card',
+        '.menu-product',
+        
+        # Restaurant-specific patterns
+        '.menu-section-item',
+        '.restaurant-menu-item',
+        '.food-card',
+        
+        # Yelp-specific
+        '.menu-item-details',
+        '.arrange-unit__09f24__rqHTg',
+        '.menuItem__09f24__mp84j'
+    ]
+    
+    IMAGE_SELECTORS = [
+        'img[src*="menu"]',
+        'img[alt*="menu"]',
+        'img[class*="menu"]',
+        '.menu-image img',
+        '[data-test*="menu"] img',
+        'a[href*="menu"] img',
+        '.photo-box img',
+        '.biz-photo img'
+    ]
+    
+    # Containers whose text is scanned for prices instead of the whole body
+    # (nav, footer, ads) when one holds a meaningful amount of text
+    MENU_CONTAINER_SELECTORS = [
+        'main',
+        '[role="main"]',
+        '.menu',
+        '.menu-container',
+        '[class*="menu"]',
+        '[id*="menu"]'
+    ]
+    
+    # Page text beyond this many characters is not fed to the price regexes
+    MAX_PAGE_TEXT = 200_000
+    
+    # Common size menu images are resized to so EasyOCR can batch them
+    OCR_BATCH_WIDTH = 800
+    OCR_BATCH_HEIGHT = 600
+    
+    # Downloaded images larger than this on their longest side are shrunk
+    # before OCR
+    MAX_OCR_IMAGE_SIDE = 2000
+    
+    # Items found on the page as loaded that score this high (3 per
+    # high-confidence item, 1 otherwise) and number at least this many make
+    # the dynamic-content pass unnecessary
+    GOOD_ENOUGH_SCORE = 10
+    GOOD_ENOUGH_ITEMS = 5
+    
+    # OCR and review mining are skipped once a scrape has run this long (s)
+    SCRAPE_BUDGET = 60.0
+    
+    # Menu images fetched with requests are cached on disk (with
+    # requests-cache) for a day unless their Cache-Control says otherwise
+    HTTP_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.menuscraper', 'http_cache')
+    HTTP_CACHE_EXPIRE = 86400
+    
+    # Per-host record of the selector that last worked in each walk, so a
+    # repeat visit tries it first. Least recently used hosts are dropped
+    # beyond SELECTOR_CACHE_SIZE, and the file is rewritten at most once
+    # per SELECTOR_CACHE_SAVE_INTERVAL seconds (and on close)
+    SELECTOR_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.menuscraper', 'selector_cache.json')
+    SELECTOR_CACHE_SIZE = 500
+    SELECTOR_CACHE_SAVE_INTERVAL = 30.0
+    
+    def __init__(self, pool_size: int = 5, block_resources: bool = True, selector_cache_path: Optional[str] = SELECTOR_CACHE_PATH):
+        self.pool = BrowserPool(pool_size=pool_size, block_resources=block_resources)
+        self.session = self._build_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        # Async client for menu image downloads, created on first use so it
+        # belongs to the running event loop
+        self._http = None
+        
+        self.selector_cache_path = selector_cache_path
+        self._selector_cache: Dict[str, Dict[str, str]] = self._load_selector_cache()
+        self._selector_cache_dirty = False
+        self._selector_cache_saved_at = time.monotonic()
+        
+        # Load (and warm up) the OCR models now, so their multi-second start
+        # is not paid inside the first scrape that falls back to OCR
+        self.easyocr_reader = self._init_easyocr_reader()
     
-    def get_easyocr_reader(self):
-        """Initialize EasyOCR reader if not already done"""
-        if self.easyocr_reader is None:
+    def _build_session(self) -> requests.Session:
+        """A requests session with a larger connection pool and retries,
+        backed by an on-disk HTTP cache when requests-cache is installed"""
+        session = None
+        if REQUESTS_CACHE_AVAILABLE:
             try:
-                self.easyocr_reader = easyocr.Reader(['en'])
-                print("✅ EasyOCR initialized successfully")
+                os.makedirs(os.path.dirname(self.HTTP_CACHE_PATH), exist_ok=True)
+                session = requests_cache.CachedSession(
+                    self.HTTP_CACHE_PATH,
+                    backend='sqlite',
+                    expire_after=self.HTTP_CACHE_EXPIRE,
+                    cache_control=True
+                )
             except Exception as e:
-                print(f"❌ EasyOCR initialization failed: {e}")
-        return self.easyocr_reader
+                print(f"⚠️ HTTP cache unavailable: {e}")
+        if session is None:
+            session = requests.Session()
+        
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def _load_selector_cache(self) -> Dict[str, Dict[str, str]]:
+        """Read the persisted selector cache, or start empty"""
+        if not self.selector_cache_path:
+            return {}
+        try:
+            with open(self.selector_cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        return {host: entry for host, entry in cache.items() if isinstance(entry, dict)}
+    
+    def _save_selector_cache(self, force: bool = False):
+        """Persist the selector cache if it changed, at most once per interval unless forced"""
+        if not self.selector_cache_path or not self._selector_cache_dirty:
+            return
+        now = time.monotonic()
+        if not force and now - self._selector_cache_saved_at < self.SELECTOR_CACHE_SAVE_INTERVAL:
+            return
+        # Write a private temp file and swap it in, so concurrent scrapers
+        # never see (or interleave into) a half-written cache
+        tmp_path = f"{self.selector_cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.selector_cache_path) or '.', exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._selector_cache, f, indent=2)
+            os.replace(tmp_path, self.selector_cache_path)
+        except OSError as e:
+            print(f"⚠️ Could not save selector cache: {e}")
+            return
+        self._selector_cache_dirty = False
+        self._selector_cache_saved_at = now
+    
+    def _cached_first(self, host: str, kind: str, selectors: List[str]) -> List[str]:
+        """Return `selectors` with the one that last worked on `host` moved to the front"""
+        cached = self._selector_cache.get(host, {}).get(kind)
+        if cached not in selectors or cached == selectors[0]:
+            return selectors
+        return [cached] + [sel for sel in selectors if sel != cached]
+    
+    def _remember_selector(self, host: str, kind: str, selector: str):
+        """Record the selector that worked on `host` and mark the host most recently used"""
+        if not host:
+            return
+        entry = self._selector_cache.pop(host, {})
+        self._selector_cache[host] = entry
+        if entry.get(kind) != selector:
+            entry[kind] = selector
+            self._selector_cache_dirty = True
+        while len(self._selector_cache) > self.SELECTOR_CACHE_SIZE:
+            del self._selector_cache[next(iter(self._selector_cache))]
+            self._selector_cache_dirty = True
+        self._save_selector_cache()
+    
+    def _init_easyocr_reader(self):
+        """Build the EasyOCR reader on the GPU when CUDA is available, else on CPU
+        
+        MENUSCRAPER_OCR_BACKEND=onnx runs its models with ONNX Runtime instead
+        of PyTorch (needs onnxruntime).
+        """
+        try:
+            import torch
+            gpu = torch.cuda.is_available()
+        except Exception:
+            gpu = False
+        
+        use_onnx = os.environ.get('MENUSCRAPER_OCR_BACKEND', 'torch').lower() == 'onnx'
+        if use_onnx and not ONNXRUNTIME_AVAILABLE:
+            print("⚠️ MENUSCRAPER_OCR_BACKEND=onnx but onnxruntime is not installed, using PyTorch")
+            use_onnx = False
+        
+        try:
+            # quantize applies dynamic int8 quantization when running on CPU;
+            # the ONNX export needs the float models
+            reader = easyocr.Reader(['en'], gpu=gpu, quantize=not use_onnx, cudnn_benchmark=gpu)
+            backend = 'GPU' if gpu else 'CPU'
+            if use_onnx:
+                try:
+                    backend = f"ONNX Runtime, {use_onnx_ocr_models(reader)}"
+                except Exception as e:
+                    print(f"⚠️ ONNX OCR backend failed, using PyTorch: {e}")
+            if not gpu and not isinstance(getattr(reader, 'recognizer', None), OnnxModel) and self._quantize_recognizer(reader):
+                backend = 'CPU, int8'
+            
+            # Warm up once (which also lets the int8 kernels get picked); on the GPU also run a full-size batch so cuDNN
+            # autotuning happens here rather than during a scrape
+            reader.readtext(np.zeros((64, 256, 3), dtype=np.uint8))
+            if gpu:
+                reader.readtext_batched(
+                    np.zeros([4, self.OCR_BATCH_HEIGHT, self.OCR_BATCH_WIDTH, 3], dtype=np.uint8)
+                )
+            print(f"✅ EasyOCR initialized successfully ({backend})")
+            return reader
+        except Exception as e:
+            print(f"❌ EasyOCR initialization failed: {e}")
+            return None
+    
+    def _quantize_recognizer(self, reader) -> bool:
+        """Make sure the CPU recognizer runs its LSTM/Linear layers in int8
+        
+        EasyOCR's quantize option silently keeps the float model if dynamic
+        quantization fails (and is off for the ONNX fallback), so check for
+        quantized layers and quantize here when they are missing.
+        """
+        try:
+            import torch
+            if any('quantized' in type(module).__module__ for module in reader.recognizer.modules()):
+                return True
+            reader.recognizer = torch.quantization.quantize_dynamic(
+                reader.recognizer, {torch.nn.Linear, torch.nn.LSTM}, dtype=torch.qint8
+            )
+            return True
+        except Exception as e:
+            print(f"⚠️ int8 quantization of the OCR recognizer failed: {e}")
+            return False
     
     def find_restaurant_website(self, restaurant_name: str, location: str) -> Optional[str]:
         """Find restaurant's official website using Google search"""
@@ -52,7 +632,7 @@ class EnhancedMenuScraper:
             print(f"Website search failed: {e}")
             return None
     
-    def enhanced_menu_detection(self, page, restaurant_url: str) -> Dict[str, Any]:
+    async def enhanced_menu_detection(self, page, restaurant_url: str) -> Dict[str, Any]:
         """Enhanced menu detection with multiple strategies"""
         menu_data = {
             'menu_items': [],
@@ -63,41 +643,45 @@ class EnhancedMenuScraper:
             'source': 'enhanced_scraping'
         }
         
+        started = time.monotonic()
         try:
             print(f"    🔍 Enhanced menu detection for: {restaurant_url}")
             
             # Navigate to restaurant page
-            page.goto(restaurant_url, timeout=30000)
-            page.wait_for_load_state('networkidle', timeout=15000)
+            await page.goto(restaurant_url, timeout=30000)
+            await page.wait_for_load_state('networkidle', timeout=15000)
             
             # Strategy 1: Enhanced menu link detection
-            menu_url = self.find_menu_page(page, restaurant_url)
+            menu_url = await self.find_menu_page(page, restaurant_url)
             if menu_url:
                 menu_data['menu_url'] = menu_url
-                page.goto(menu_url, timeout=20000)
-                page.wait_for_load_state('networkidle', timeout=10000)
-            
-            # Strategy 2: Dynamic content loading
-            self.trigger_dynamic_content(page)
+                await page.goto(menu_url, timeout=20000)
+                await page.wait_for_load_state('networkidle', timeout=10000)
             
-            # Strategy 3: Enhanced menu item extraction
-            menu_items = self.extract_menu_items_enhanced(page)
+            # Strategy 2: Enhanced menu item extraction. Dynamic content
+            # loading (several seconds of fixed waits) and a second
+            # extraction only happen if the page as loaded is not enough
+            menu_items = await self.extract_menu_items_enhanced(page)
+            if not self.is_good_enough(menu_items):
+                await self.trigger_dynamic_content(page)
+                menu_items = await self.extract_menu_items_enhanced(page)
             
-            # Strategy 4: OCR fallback for images
-            if len(menu_items) == 0:
+            # Strategy 3: OCR fallback for images
+            if len(menu_items) == 0 and self.within_budget(started, menu_data):
                 print("    📸 Attempting OCR extraction...")
-                ocr_items = self.extract_menu_from_images(page)
+                ocr_items = await self.extract_menu_from_images(page)
                 if ocr_items:
                     menu_items.extend(ocr_items)
                     menu_data['ocr_used'] = True
             
-            # Strategy 5: Review mining
-            if len(menu_items) == 0:
+            # Strategy 4: Review mining
+            if len(menu_items) == 0 and self.within_budget(started, menu_data):
                 print("    💬 Mining reviews for menu items...")
-                review_items = self.extract_menu_from_reviews(page)
+                review_items = await self.extract_menu_from_reviews(page)
                 menu_items.extend(review_items)
             
-            menu_data['menu_items'] = menu_items
+            menu_items = self.dedupe_menu_items(menu_items)
+            menu_data['menu_items'] = [asdict(item) for item in menu_items]
             menu_data['total_items'] = len(menu_items)
             menu_data['scraping_success'] = len(menu_items) > 0
             
@@ -113,52 +697,128 @@ class EnhancedMenuScraper:
             menu_data['error'] = str(e)
             return menu_data
     
-    def find_menu_page(self, page, base_url: str) -> Optional[str]:
+    def dedupe_menu_items(self, menu_items: List[MenuItem]) -> List[MenuItem]:
+        """Drop items whose name (ignoring case and surrounding space) was
+        already seen; nameless items are compared by description"""
+        seen_names = set()
+        unique_items = []
+        for item in menu_items:
+            key = (item.name or item.description).strip().casefold()
+            if key not in seen_names:
+                seen_names.add(key)
+                unique_items.append(item)
+        return unique_items
+    
+    def is_good_enough(self, menu_items: List[MenuItem]) -> bool:
+        """Whether extracted items are plentiful and confident enough to stop looking"""
+        score = sum(3 if item.confidence == 'high' else 1 for item in menu_items)
+        return score >= self.GOOD_ENOUGH_SCORE and len(menu_items) >= self.GOOD_ENOUGH_ITEMS
+    
+    def within_budget(self, started: float, menu_data: Dict[str, Any]) -> bool:
+        """Whether a scrape begun at `started` may still run its slow fallbacks"""
+        if time.monotonic() - started <= self.SCRAPE_BUDGET:
+            return True
+        if not menu_data.get('budget_exceeded'):
+            print("    ⏱️ Time budget spent, skipping the remaining fallbacks")
+            menu_data['budget_exceeded'] = True
+        return False
+    
+    async def scrape_one(self, restaurant_url: str) -> Dict[str, Any]:
+        """Run enhanced menu detection for one URL on a page from the pool"""
+        async with self.pool.acquire() as page:
+            return await self.enhanced_menu_detection(page, restaurant_url)
+    
+    async def scrape_many(self, restaurant_urls: List[str], max_concurrency: int = 5) -> List[Dict[str, Any]]:
+        """Scrape several restaurant URLs concurrently on one shared browser
+        
+        At most `max_concurrency` pages (and never more than the pool size)
+        load at once. The browser is launched once for the whole batch and
+        closed afterwards. Results keep input order; a URL that fails outside
+        enhanced_menu_detection (browser launch, opening a page) gets its own
+        error result instead of failing the whole batch.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def bounded(restaurant_url: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self.scrape_one(restaurant_url)
+                except Exception as e:
+                    print(f"    ❌ Scraping {restaurant_url} failed: {str(e)}")
+                    return {
+                        'menu_items': [],
+                        'menu_url': None,
+                        'total_items': 0,
+                        'scraping_success': False,
+                        'ocr_used': False,
+                        'source': 'enhanced_scraping',
+                        'error': str(e)
+                    }
+        
+        try:
+            return await asyncio.gather(*(bounded(url) for url in restaurant_urls))
+        finally:
+            await self.close()
+    
+    async def close(self):
+        """Release the browser pool and the image download client, and save the selector cache"""
+        self._save_selector_cache(force=True)
+        await self.pool.close()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
+    async def find_menu_page(self, page, base_url: str) -> Optional[str]:
         """Enhanced menu page detection"""
-        menu_selectors = [
-            # Standard menu links
-            'a[href*="menu"]',
-            'a:has-text("Menu")',
-            'a:has-text("View Menu")',
-            'a:has-text("Our Menu")',
-            'a:has-text("Food Menu")',
-            'button:has-text("Menu")',
-            
-            # Data attributes
-            '[data-test*="menu"]',
-            '[data-menu]',
-            '[data-testid*="menu"]',
-            
-            # Class-based detection
-            '.menu-link',
-            '.view-menu',
-            '.menu-button',
-            
-            # Yelp-specific
-            'a[href*="/menu/"]',
-            '.menu-tab',
-            '.biz-menu-link'
-        ]
+        # Like locator(selector).first per selector: take the first match,
+        # and accept it only if it is visible and has an href. The
+        # Playwright-only :has-text("...") suffix is applied as a
+        # case-insensitive text filter. The selector that last worked on this
+        # host is tried first
+        host = urlparse(base_url).netloc
+        selectors = self._cached_first(host, 'menu_link', self.MENU_LINK_SELECTORS)
+        try:
+            found = await page.evaluate(
+                """(sels) => {
+                    for (const sel of sels) {
+                        const hasText = sel.match(/^(.*):has-text\\("(.*)"\\)$/);
+                        let els;
+                        try {
+                            els = Array.from(document.querySelectorAll(hasText ? hasText[1] : sel));
+                        } catch (e) {
+                            continue;
+                        }
+                        if (hasText) {
+                            const needle = hasText[2].toLowerCase();
+                            els = els.filter(e => (e.textContent || '').replace(/\\s+/g, ' ').toLowerCase().includes(needle));
+                        }
+                        const link = els[0];
+                        if (!link || link.getClientRects().length === 0 || getComputedStyle(link).visibility === 'hidden') {
+                            continue;
+                        }
+                        const href = link.getAttribute('href');
+                        if (href) return {index: sels.indexOf(sel), href: href};
+                    }
+                    return null;
+                }""",
+                selectors
+            )
+        except Exception:
+            return None
         
-        for selector in menu_selectors:
-            try:
-                menu_link = page.locator(selector).first
-                if menu_link.is_visible(timeout=2000):
-                    menu_url = menu_link.get_attribute('href')
-                    if menu_url:
-                        full_url = urljoin(base_url, menu_url)
-                        print(f"    📋 Found menu link: {full_url}")
-                        return full_url
-            except:
-                continue
+        if found:
+            self._remember_selector(host, 'menu_link', selectors[found['index']])
+            full_url = urljoin(base_url, found['href'])
+            print(f"    📋 Found menu link: {full_url}")
+            return full_url
         
         return None
     
-    def trigger_dynamic_content(self, page):
+    async def trigger_dynamic_content(self, page):
         """Trigger dynamic content loading"""
         try:
             # Wait for page to be fully loaded
-            page.wait_for_function("document.readyState === 'complete'", timeout=5000)
+            await page.wait_for_function("document.readyState === 'complete'", timeout=5000)
             
             # Click menu triggers
             menu_triggers = [
@@ -171,108 +831,132 @@ class EnhancedMenuScraper:
             
             for trigger in menu_triggers:
                 try:
-                    if page.locator(trigger).is_visible(timeout=1000):
-                        page.click(trigger)
-                        page.wait_for_timeout(2000)
+                    if await page.locator(trigger).is_visible(timeout=1000):
+                        await page.click(trigger)
+                        await page.wait_for_timeout(2000)
                         break
                 except:
                     continue
             
             # Scroll to load lazy content
-            page.evaluate("""
+            await page.evaluate("""
                 window.scrollTo(0, document.body.scrollHeight);
                 setTimeout(() => window.scrollTo(0, 0), 1000);
             """)
-            page.wait_for_timeout(2000)
+            await page.wait_for_timeout(2000)
             
         except Exception as e:
             print(f"    ⚠️ Dynamic content loading failed: {e}")
     
-    def extract_menu_items_enhanced(self, page) -> List[Dict[str, Any]]:
+    async def extract_menu_items_enhanced(self, page) -> List[MenuItem]:
         """Enhanced menu item extraction with multiple strategies"""
         menu_items = []
         
-        # Strategy 1: Enhanced structured selectors
-        structured_selectors = [
-            # Standard menu item patterns
-            '[class*="menu-item"]',
-            '[data-test*="menu-item"]',
-            '.menu-item',
-            '.dish',
-            '.food-item',
-            
-            # Food delivery patterns
-            '[class*="dish"]',
-            '[class*="food-item"]',
-            '.item-card',
-            '.product-card',
-            '.menu-product',
-            
-            # Restaurant-specific patterns
-            '.menu-section-item',
-            '.restaurant-menu-item',
-            '.food-card',
-            
-            # Yelp-specific
-            '.menu-item-details',
-            '.arrange-unit__09f24__rqHTg',
-            '.menuItem__09f24__mp84j'
-        ]
-        
-        for selector in structured_selectors:
+        # Strategy 1: Enhanced structured selectors. Each evaluate returns the
+        # first selector (from `start`) with matches, with the match count and
+        # the text of its first 20 items; the walk only resumes past it if
+        # none of those texts parsed into menu items. The selector that last
+        # worked on this host is tried first
+        host = urlparse(page.url).netloc
+        selectors = self._cached_first(host, 'menu_item', self.STRUCTURED_SELECTORS)
+        start = 0
+        while start < len(selectors):
             try:
-                items = page.locator(selector).all()
-                if len(items) > 0:
-                    print(f"    📝 Found {len(items)} items with selector: {selector}")
-                    for item in items[:20]:  # Limit to 20 items
-                        try:
-                            item_data = self.parse_menu_item(item)
-                            if item_data:
-                                menu_items.append(item_data)
-                        except:
-                            continue
-                    if menu_items:
-                        break
-            except:
-                continue
+                found = await page.evaluate(
+                    """({sels, start}) => {
+                        for (let i = start; i < sels.length; i++) {
+                            let els;
+                            try {
+                                els = document.querySelectorAll(sels[i]);
+                            } catch (e) {
+                                continue;
+                            }
+                            if (els.length > 0) {
+                                return {index: i, count: els.length, texts: Array.from(els).slice(0, 20).map(e => e.innerText)};
+                            }
+                        }
+                        return null;
+                    }""",
+                    {'sels': selectors, 'start': start}
+                )
+            except Exception:
+                break
+            
+            if not found:
+                break
+            
+            selector = selectors[found['index']]
+            print(f"    📝 Found {found['count']} items with selector: {selector}")
+            # Limit to 20 items
+            menu_items.extend(item for item in self.parse_menu_items(found['texts']) if item)
+            if menu_items:
+                self._remember_selector(host, 'menu_item', selector)
+                break
+            
+            start = found['index'] + 1
         
         # Strategy 2: Enhanced price-based extraction
         if len(menu_items) == 0:
-            menu_items = self.extract_by_price_patterns(page)
+            menu_items = await self.extract_by_price_patterns(page)
         
         # Strategy 3: Table-based extraction
         if len(menu_items) == 0:
-            menu_items = self.extract_from_tables(page)
+            menu_items = await self.extract_from_tables(page)
         
-        return menu_items
+        return self.dedupe_menu_items(menu_items)
+    
+    def parse_menu_item(self, item_text: str) -> Optional[MenuItem]:
+        """Parse individual menu item text with enhanced extraction"""
+        return self.parse_menu_items([item_text])[0]
     
-    def parse_menu_item(self, item_element) -> Optional[Dict[str, Any]]:
-        """Parse individual menu item with enhanced extraction"""
+    def parse_menu_items(self, item_texts: List[str]) -> List[Optional[MenuItem]]:
+        """Parse a batch of menu item texts, classifying all of them in one pass"""
+        parts = [self._split_menu_item_text(item_text) for item_text in item_texts]
+        classifications = iter(self.classify_texts([part[1] for part in parts if part]))
+        
+        items = []
+        for part in parts:
+            if not part:
+                items.append(None)
+                continue
+            name, description, price = part
+            
+            # Skip if not food-related
+            food, _, allergens = next(classifications)
+            if not food:
+                items.append(None)
+                continue
+            
+            items.append(MenuItem(
+                name=name,
+                description=description,
+                price=price,
+                potential_allergens=allergens,
+                source='structured_extraction',
+                confidence='high' if price else 'medium'
+            ))
+        
+        return items
+    
+    def _split_menu_item_text(self, item_text: str) -> Optional[Tuple[str, str, Optional[str]]]:
+        """Split menu item text into (name, description, price), or None if too short"""
         try:
-            item_text = item_element.inner_text().strip()
+            item_text = item_text.strip()
             if len(item_text) < 5:
                 return None
             
             # Enhanced price extraction
-            price_patterns = [
-                r'\$([0-9]+(?:\.[0-9]{2})?)',  # $12.99
-                r'([0-9]+(?:\.[0-9]{2})?)\s*\$',  # 12.99 $
-                r'\$\s*([0-9]+(?:\.[0-9]{2})?)',  # $ 12.99
-                r'USD\s*([0-9]+(?:\.[0-9]{2})?)',  # USD 12.99
-                r'([0-9]+)\s*dollars?',  # 12 dollars
-            ]
-            
             price = None
-            for pattern in price_patterns:
-                price_match = re.search(pattern, item_text, re.IGNORECASE)
+            for pattern in _ITEM_PRICE_RES:
+                price_match = pattern.search(item_text)
                 if price_match:
                     price = f"${price_match.group(1)}"
                     break
             
             # Clean description
             description = item_text
-            for pattern in price_patterns:
-                description = re.sub(pattern, '', description, flags=re.IGNORECASE)
+            for pattern in _ITEM_PRICE_RES:
+                description = pattern.sub('', description)
             description = description.strip()
             
             # Extract name (first line or sentence)
@@ -280,59 +964,49 @@ class EnhancedMenuScraper:
             name = name_parts[0].strip() if name_parts else description
             name = name.split('.')[0].strip()[:60]
             
-            # Skip if not food-related
-            if not self.is_food_related(description):
-                return None
-            
-            # Extract allergens
-            allergens = self.extract_allergen_info(description)
-            
-            return {
-                'name': name,
-                'description': description,
-                'price': price,
-                'potential_allergens': allergens,
-                'source': 'structured_extraction',
-                'confidence': 'high' if price else 'medium'
-            }
+            return name, description, price
             
         except Exception as e:
             return None
     
-    def extract_by_price_patterns(self, page) -> List[Dict[str, Any]]:
+    async def extract_by_price_patterns(self, page) -> List[MenuItem]:
         """Enhanced price-based menu extraction"""
         menu_items = []
         
         try:
-            page_text = page.inner_text('body')
-            
-            # Enhanced price patterns with food context
-            price_patterns = [
-                r'([A-Z][^$\n]{10,80}(?:chicken|beef|fish|pasta|salad|soup|pizza|burger|sandwich|steak|seafood|vegetarian|dessert|appetizer|entree|special)[^$\n]{0,30})\s*\$([0-9]+(?:\.[0-9]{2})?)',
-                r'([^$\n]{15,100})\s*\$([0-9]+(?:\.[0-9]{2})?)',
-                r'([A-Z][^\n]{20,80})\s*-\s*\$([0-9]+(?:\.[0-9]{2})?)',
-                r'([A-Z][^\n]{15,60})\s*\.{2,}\s*\$([0-9]+(?:\.[0-9]{2})?)',
-            ]
+            page_text = await page.evaluate(
+                """({sels, maxText}) => {
+                    for (const sel of sels) {
+                        const node = document.querySelector(sel);
+                        if (node && node.innerText.length > 200) return node.innerText.slice(0, maxText);
+                    }
+                    return document.body.innerText.slice(0, maxText);
+                }""",
+                {'sels': self.MENU_CONTAINER_SELECTORS, 'maxText': self.MAX_PAGE_TEXT}
+            )
             
-            for pattern in price_patterns:
-                matches = re.findall(pattern, page_text, re.MULTILINE | re.IGNORECASE)
-                for description, price in matches[:15]:
+            # Every pattern needs a '$', and only the first 15 matches of a
+            # pattern are used, so stop scanning the page once those are found
+            patterns = _PAGE_PRICE_RES if '$' in page_text else []
+            for pattern in patterns:
+                candidates = []
+                for match in islice(pattern.finditer(page_text), 15):
+                    description, price = match.groups()
                     description = description.strip()
-                    
-                    if (len(description) > 10 and 
-                        self.is_food_related(description) and
-                        not self.is_excluded_content(description)):
-                        
-                        allergens = self.extract_allergen_info(description)
-                        
-                        menu_items.append({
-                            'name': description.split('.')[0].strip()[:60],
-                            'description': description,
-                            'price': f'${price}',
-                            'potential_allergens': allergens,
-                            'source': 'price_pattern_extraction',
-                            'confidence': 'high'
-                        })
+                    if len(description) > 10:
+                        candidates.append((description, price))
+                
+                classifications = self.classify_texts([description for description, _ in candidates])
+                for (description, price), (food, excluded, allergens) in zip(candidates, classifications):
+                    if food and not excluded:
+                        menu_items.append(MenuItem(
+                            name=description.split('.')[0].strip()[:60],
+                            description=description,
+                            price=f'${price}',
+                            potential_allergens=allergens,
+                            source='price_pattern_extraction',
+                            confidence='high'
+                        ))
                 
                 if len(menu_items) > 0:
                     break
@@ -344,7 +1018,7 @@ class EnhancedMenuScraper:
             print(f"    ❌ Price-based extraction failed: {e}")
             return []
     
-    def extract_from_tables(self, page) -> List[Dict[str, Any]]:
+    async def extract_from_tables(self, page) -> List[MenuItem]:
         """Extract menu items from table structures"""
         menu_items = []
         
@@ -353,33 +1027,41 @@ class EnhancedMenuScraper:
             table_selectors = ['table', '.menu-table', '[class*="table"]']
             
             for selector in table_selectors:
-                tables = page.locator(selector).all()
-                for table in tables:
-                    rows = table.locator('tr').all()
+                # Every row of every matching table in one round-trip; cell
+                # texts are only sent for rows that can hold a price
+                tables = await page.locator(selector).evaluate_all(
+                    """tables => tables.map(table => Array.from(table.querySelectorAll('tr'), row => {
+                        const text = row.innerText;
+                        const cells = text.includes('$')
+                            ? Array.from(row.querySelectorAll('td, th'), cell => cell.innerText)
+                            : [];
+                        return {text, cells};
+                    }))"""
+                )
+                for rows in tables:
                     for row in rows:
                         try:
-                            row_text = row.inner_text().strip()
+                            row_text = row['text'].strip()
                             if len(row_text) > 10 and '$' in row_text:
                                 # Parse table row
-                                cells = row.locator('td, th').all()
+                                cells = row['cells']
                                 if len(cells) >= 2:
-                                    name_cell = cells[0].inner_text().strip()
-                                    price_cell = cells[-1].inner_text().strip()
+                                    name_cell = cells[0].strip()
+                                    price_cell = cells[-1].strip()
                                     
-                                    if self.is_food_related(name_cell) and '$' in price_cell:
-                                        price_match = re.search(r'\$([0-9]+(?:\.[0-9]{2})?)', price_cell)
+                                    food, _, allergens = self.classify_text(name_cell)
+                                    if food and '$' in price_cell:
+                                        price_match = _DOLLAR_PRICE_RE.search(price_cell)
                                         price = f"${price_match.group(1)}" if price_match else None
                                         
-                                        allergens = self.extract_allergen_info(name_cell)
-                                        
-                                        menu_items.append({
-                                            'name': name_cell[:60],
-                                            'description': name_cell,
-                                            'price': price,
-                                            'potential_allergens': allergens,
-                                            'source': 'table_extraction',
-                                            'confidence': 'medium'
-                                        })
+                                        menu_items.append(MenuItem(
+                                            name=name_cell[:60],
+                                            description=name_cell,
+                                            price=price,
+                                            potential_allergens=allergens,
+                                            source='table_extraction',
+                                            confidence='medium'
+                                        ))
                         except:
                             continue
                 
@@ -393,44 +1075,60 @@ class EnhancedMenuScraper:
             print(f"    ❌ Table extraction failed: {e}")
             return []
     
-    def extract_menu_from_images(self, page) -> List[Dict[str, Any]]:
+    async def extract_menu_from_images(self, page) -> List[MenuItem]:
         """Extract menu items from images using OCR"""
         menu_items = []
         
         try:
-            reader = self.get_easyocr_reader()
-            if not reader:
+            if not self.easyocr_reader:
                 return []
             
-            # Enhanced image selectors
-            image_selectors = [
-                'img[src*="menu"]',
-                'img[alt*="menu"]',
-                'img[class*="menu"]',
-                '.menu-image img',
-                '[data-test*="menu"] img',
-                'a[href*="menu"] img',
-                '.photo-box img',
-                '.biz-photo img'
-            ]
-            
-            for selector in image_selectors:
+            # Each evaluate returns the first selector (from `start`) whose
+            # first 3 images include a menu/food src, trying the selector that
+            # last worked on this host first
+            host = urlparse(page.url).netloc
+            selectors = self._cached_first(host, 'menu_image', self.IMAGE_SELECTORS)
+            start = 0
+            while start < len(selectors):
                 try:
-                    images = page.locator(selector).all()
-                    for img in images[:3]:  # Limit to 3 images
-                        try:
-                            # Get image source
-                            img_src = img.get_attribute('src')
-                            if img_src and ('menu' in img_src.lower() or 'food' in img_src.lower()):
-                                # Download and process image
-                                ocr_text = self.process_image_ocr(img_src)
-                                if ocr_text:
-                                    parsed_items = self.parse_menu_from_ocr_text(ocr_text)
-                                    menu_items.extend(parsed_items)
-                        except:
-                            continue
+                    found = await page.evaluate(
+                        """({sels, start}) => {
+                            for (let i = start; i < sels.length; i++) {
+                                let els;
+                                try {
+                                    els = document.querySelectorAll(sels[i]);
+                                } catch (e) {
+                                    continue;
+                                }
+                                const srcs = Array.from(els).slice(0, 3)
+                                    .map(e => e.getAttribute('src'))
+                                    .filter(src => src && (src.toLowerCase().includes('menu') || src.toLowerCase().includes('food')));
+                                if (srcs.length > 0) return {index: i, srcs: srcs};
+                            }
+                            return null;
+                        }""",
+                        {'sels': selectors, 'start': start}
+                    )
+                except Exception:
+                    break
+                if not found:
+                    break
+                start = found['index'] + 1
+                
+                try:
+                    img_srcs = [urljoin(page.url, img_src) for img_src in found['srcs']]
+                    
+                    # Download concurrently, then OCR all of this selector's
+                    # images in one batch off the event loop
+                    img_arrays = await self.download_images(img_srcs)
+                    loop = asyncio.get_running_loop()
+                    for ocr_text in await loop.run_in_executor(None, self.ocr_images, img_arrays):
+                        if ocr_text:
+                            parsed_items = self.parse_menu_from_ocr_text(ocr_text)
+                            menu_items.extend(parsed_items)
                     
                     if menu_items:
+                        self._remember_selector(host, 'menu_image', selectors[found['index']])
                         break
                 except:
                     continue
@@ -444,29 +1142,126 @@ class EnhancedMenuScraper:
     
     def process_image_ocr(self, img_src: str) -> str:
         """Process image with OCR"""
+        img_array = self.download_image(img_src)
+        if img_array is None:
+            return ""
+        return self.ocr_images([img_array])[0]
+    
+    def download_image(self, img_src: str) -> Optional[np.ndarray]:
+        """Download an image as a numpy array for EasyOCR, or None on failure"""
         try:
-            # Download image
             response = self.session.get(img_src, timeout=10)
             if response.status_code == 200:
-                # Convert to PIL Image
-                image = Image.open(io.BytesIO(response.content))
-                
-                # Convert to numpy array for EasyOCR
-                img_array = np.array(image)
-                
-                # Extract text
-                results = self.easyocr_reader.readtext(img_array)
-                
-                # Combine text
-                text_lines = [result[1] for result in results if result[2] > 0.5]
-                return '\n'.join(text_lines)
+                return self.decode_image(response.content)
             
         except Exception as e:
             print(f"    ⚠️ Image OCR failed: {e}")
         
-        return ""
+        return None
+    
+    async def download_images(self, img_srcs: List[str]) -> List[np.ndarray]:
+        """Download several images concurrently; failed downloads are dropped"""
+        if not img_srcs:
+            return []
+        
+        # With requests-cache the (thread-pooled) cached session is used so
+        # that repeat runs are served from disk
+        if REQUESTS_CACHE_AVAILABLE or not HTTPX_AVAILABLE:
+            loop = asyncio.get_running_loop()
+            img_arrays = await asyncio.gather(
+                *(loop.run_in_executor(None, self.download_image, img_src) for img_src in img_srcs)
+            )
+            return [img_array for img_array in img_arrays if img_array is not None]
+        
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(
+                    http2=HTTP2_AVAILABLE,
+                    retries=2,
+                    limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+                ),
+                timeout=10.0,
+                follow_redirects=True,
+                headers={'User-Agent': self.session.headers['User-Agent']}
+            )
+        
+        responses = await asyncio.gather(
+            *(self._http.get(img_src) for img_src in img_srcs), return_exceptions=True
+        )
+        
+        # Decoding is CPU-bound, so it runs in the default thread pool
+        loop = asyncio.get_running_loop()
+        decodes = []
+        for response in responses:
+            if isinstance(response, Exception):
+                print(f"    ⚠️ Image OCR failed: {response}")
+            elif response.status_code == 200:
+                decodes.append(loop.run_in_executor(None, self.decode_image, response.content))
+        
+        img_arrays = await asyncio.gather(*decodes)
+        return [img_array for img_array in img_arrays if img_array is not None]
+    
+    def decode_image(self, content: bytes) -> Optional[np.ndarray]:
+        """Decode downloaded image bytes into a numpy array for EasyOCR"""
+        try:
+            # OpenCV decodes straight into a BGR array; EasyOCR wants RGB
+            img_array = cv2.imdecode(np.frombuffer(content, dtype=np.uint8), cv2.IMREAD_COLOR)
+            if img_array is not None:
+                img_array = cv2.cvtColor(img_array, cv2.COLOR_BGR2RGB)
+            else:
+                # Formats this OpenCV build cannot read (e.g. GIF) go through PIL
+                img_array = np.array(Image.open(io.BytesIO(content)).convert('RGB'))
+            
+            longest_side = max(img_array.shape[:2])
+            if longest_side > self.MAX_OCR_IMAGE_SIDE:
+                scale = self.MAX_OCR_IMAGE_SIDE / longest_side
+                img_array = cv2.resize(img_array, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            return img_array
+        except Exception as e:
+            print(f"    ⚠️ Image OCR failed: {e}")
+            return None
+    
+    def ocr_images(self, img_arrays: List[np.ndarray]) -> List[str]:
+        """OCR a batch of images and return the confident text of each"""
+        if not img_arrays:
+            return []
+        
+        try:
+            batch_results = self.easyocr_reader.readtext_batched(
+                img_arrays,
+                n_width=self.OCR_BATCH_WIDTH,
+                n_height=self.OCR_BATCH_HEIGHT,
+                batch_size=len(img_arrays)
+            )
+        except Exception as e:
+            print(f"    ⚠️ Batched OCR failed, reading images one by one: {e}")
+            batch_results = []
+            for img_array in img_arrays:
+                try:
+                    batch_results.append(self.easyocr_reader.readtext(img_array))
+                except Exception as e:
+                    print(f"    ⚠️ Image OCR failed: {e}")
+                    batch_results.append([])
+        
+        return [self.join_ocr_results(results) for results in batch_results]
+    
+    def join_ocr_results(self, results: List[Any]) -> str:
+        """Join the confident (> 0.5) OCR boxes top to bottom, one per line"""
+        if not results:
+            return ""
+        
+        count = len(results)
+        confidences = np.fromiter((result[2] for result in results), dtype=np.float32, count=count)
+        texts = np.array([result[1] for result in results], dtype=object)
+        # Top edge of each box (its first corner), so that name and price
+        # lines come out in reading order; ties keep EasyOCR's order
+        tops = np.fromiter((result[0][0][1] for result in results), dtype=np.float32, count=count)
+        
+        keep = confidences > 0.5
+        order = np.argsort(tops[keep], kind='stable')
+        return '\n'.join(texts[keep][order])
     
-    def parse_menu_from_ocr_text(self, ocr_text: str) -> List[Dict[str, Any]]:
+    def parse_menu_from_ocr_text(self, ocr_text: str) -> List[MenuItem]:
         """Parse menu items from OCR text"""
         menu_items = []
         
@@ -479,43 +1274,42 @@ class EnhancedMenuScraper:
                     continue
                 
                 # Look for price patterns
-                price_match = re.search(r'\$([0-9]+(?:\.[0-9]{2})?)', line)
+                price_match = _DOLLAR_PRICE_RE.search(line)
                 if price_match:
                     price = f"${price_match.group(1)}"
-                    description = re.sub(r'\$[0-9]+(?:\.[0-9]{2})?', '', line).strip()
+                    description = _DOLLAR_PRICE_RE.sub('', line).strip()
                     
-                    if self.is_food_related(description):
-                        allergens = self.extract_allergen_info(description)
-                        
-                        menu_items.append({
-                            'name': description[:60],
-                            'description': description,
-                            'price': price,
-                            'potential_allergens': allergens,
-                            'source': 'ocr_extraction',
-                            'confidence': 'medium'
-                        })
+                    food, _, allergens = self.classify_text(description)
+                    if food:
+                        menu_items.append(MenuItem(
+                            name=description[:60],
+                            description=description,
+                            price=price,
+                            potential_allergens=allergens,
+                            source='ocr_extraction',
+                            confidence='medium'
+                        ))
                 
                 # Look for food keywords without prices
-                elif self.is_food_related(line) and len(line) > 10:
+                elif len(line) > 10 and self.classify_text(line)[0]:
                     # Check next line for price
                     price = None
                     if i + 1 < len(lines):
                         next_line = lines[i + 1].strip()
-                        price_match = re.search(r'\$([0-9]+(?:\.[0-9]{2})?)', next_line)
+                        price_match = _DOLLAR_PRICE_RE.search(next_line)
                         if price_match:
                             price = f"${price_match.group(1)}"
                     
                     allergens = self.extract_allergen_info(line)
                     
-                    menu_items.append({
-                        'name': line[:60],
-                        'description': line,
-                        'price': price,
-                        'potential_allergens': allergens,
-                        'source': 'ocr_extraction',
-                        'confidence': 'low' if not price else 'medium'
-                    })
+                    menu_items.append(MenuItem(
+                        name=line[:60],
+                        description=line,
+                        price=price,
+                        potential_allergens=allergens,
+                        source='ocr_extraction',
+                        confidence='low' if not price else 'medium'
+                    ))
             
             return menu_items[:8]  # Limit results
             
@@ -523,9 +1317,10 @@ class EnhancedMenuScraper:
             print(f"    ❌ OCR text parsing failed: {e}")
             return []
     
-    def extract_menu_from_reviews(self, page) -> List[Dict[str, Any]]:
+    async def extract_menu_from_reviews(self, page) -> List[MenuItem]:
         """Extract menu items mentioned in reviews"""
         menu_items = []
+        seen_names = set()
         
         try:
             # Look for review sections
@@ -539,21 +1334,13 @@ class EnhancedMenuScraper:
             
             for selector in review_selectors:
                 try:
-                    reviews = page.locator(selector).all()
+                    reviews = await page.locator(selector).all()
                     for review in reviews[:5]:  # Limit to 5 reviews
-                        review_text = review.inner_text().strip()
+                        review_text = (await review.inner_text()).strip()
                         
                         # Extract food mentions
-                        food_patterns = [
-                            r'I ordered the ([^.!?\n]{5,40})',
-                            r'The ([^.!?\n]{5,40}) was (?:delicious|amazing|great|good|excellent)',
-                            r'Try the ([^.!?\n]{5,40})',
-                            r'([A-Z][a-z]+ [A-Z][a-z]+) is (?:delicious|amazing|great|good)',
-                            r'([A-Z][^.!?\n]{10,40}) \$([0-9]+)'
-                        ]
-                        
-                        for pattern in food_patterns:
-                            matches = re.findall(pattern, review_text, re.IGNORECASE)
+                        for pattern in _REVIEW_FOOD_RES:
+                            matches = pattern.findall(review_text)
                             for match in matches:
                                 if isinstance(match, tuple):
                                     food_name = match[0].strip()
@@ -562,20 +1349,21 @@ class EnhancedMenuScraper:
                                     food_name = match.strip()
                                     price = None
                                 
-                                if (self.is_food_related(food_name) and 
-                                    len(food_name) > 5 and 
-                                    food_name not in [item['name'] for item in menu_items]):
-                                    
-                                    allergens = self.extract_allergen_info(food_name)
-                                    
-                                    menu_items.append({
-                                        'name': food_name[:60],
-                                        'description': food_name,
-                                        'price': price,
-                                        'potential_allergens': allergens,
-                                        'source': 'review_mining',
-                                        'confidence': 'low'
-                                    })
+                                key = food_name.casefold()
+                                if len(food_name) <= 5 or key in seen_names:
+                                    continue
+                                
+                                food, _, allergens = self.classify_text(food_name)
+                                if food:
+                                    seen_names.add(key)
+                                    menu_items.append(MenuItem(
+                                        name=food_name[:60],
+                                        description=food_name,
+                                        price=price,
+                                        potential_allergens=allergens,
+                                        source='review_mining',
+                                        confidence='low'
+                                    ))
                     
                     if menu_items:
                         break
@@ -589,69 +1377,77 @@ class EnhancedMenuScraper:
             print(f"    ❌ Review mining failed: {e}")
             return []
     
+    def classify_text(self, text: str) -> Tuple[bool, bool, List[str]]:
+        """Return (is food-related, is excluded content, allergens) for text"""
+        return self.classify_texts([text])[0]
+    
+    def classify_texts(self, texts: List[str]) -> List[Tuple[bool, bool, List[str]]]:
+        """Classify a batch of texts as (is food-related, is excluded content, allergens)
+        
+        With pyahocorasick the texts are joined with NUL (which no keyword
+        contains) and the automaton walks the whole batch once, each hit
+        being mapped back to its text by offset; otherwise each text is
+        searched with one case-insensitive regex per keyword list.
+        """
+        results = []
+        
+        if _KEYWORD_AUTOMATON is None:
+            for text in texts:
+                food = _FOOD_RE.search(text) is not None
+                excluded = _EXCLUDED_RE.search(text) is not None
+                found_allergens = {
+                    allergen for allergen, allergen_re in _ALLERGEN_RES.items()
+                    if allergen_re.search(text)
+                }
+                results.append((food, excluded, found_allergens))
+        else:
+            lowered = [text.lower() for text in texts]
+            starts = []
+            offset = 0
+            for text_lower in lowered:
+                starts.append(offset)
+                offset += len(text_lower) + 1
+            
+            food = [False] * len(texts)
+            excluded = [False] * len(texts)
+            found_allergens = [set() for _ in texts]
+            for end_index, labels in _KEYWORD_AUTOMATON.iter('\0'.join(lowered)):
+                index = bisect.bisect_right(starts, end_index) - 1
+                for kind, allergen in labels:
+                    if kind == 'food':
+                        food[index] = True
+                    elif kind == 'excluded':
+                        excluded[index] = True
+                    else:
+                        found_allergens[index].add(allergen)
+            results = list(zip(food, excluded, found_allergens))
+        
+        return [
+            (food, excluded, [allergen for allergen in ALLERGEN_KEYWORDS if allergen in allergens])
+            for food, excluded, allergens in results
+        ]
+    
     def is_food_related(self, text: str) -> bool:
         """Check if text is food-related"""
-        food_keywords = [
-            'chicken', 'beef', 'fish', 'pasta', 'salad', 'soup', 'pizza', 'burger',
-            'sandwich', 'steak', 'seafood', 'vegetarian', 'dessert', 'appetizer',
-            'entree', 'special', 'grilled', 'fried', 'baked', 'roasted', 'sauteed',
-            'served', 'with', 'sauce', 'cheese', 'bread', 'rice', 'noodles',
-            'shrimp', 'lobster', 'crab', 'salmon', 'tuna', 'pork', 'lamb',
-            'wings', 'ribs', 'tacos', 'burrito', 'quesadilla', 'nachos'
-        ]
-        
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in food_keywords)
+        return self.classify_text(text)[0]
     
     def is_excluded_content(self, text: str) -> bool:
         """Check if text should be excluded"""
-        excluded_keywords = [
-            'copyright', 'privacy', 'terms', 'contact', 'address', 'phone',
-            'hours', 'location', 'directions', 'parking', 'website',
-            'follow us', 'social media', 'newsletter', 'subscribe'
-        ]
-        
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in excluded_keywords)
+        return self.classify_text(text)[1]
     
     def extract_allergen_info(self, text: str) -> List[str]:
         """Extract allergen information from text"""
-        allergens = []
-        text_lower = text.lower()
-        
-        allergen_patterns = {
-            'dairy': ['milk', 'cheese', 'butter', 'cream', 'yogurt', 'dairy'],
-            'eggs': ['egg', 'eggs', 'mayonnaise'],
-            'fish': ['fish', 'salmon', 'tuna', 'cod', 'halibut'],
-            'shellfish': ['shrimp', 'lobster', 'crab', 'oyster', 'mussel', 'clam'],
-            'tree_nuts': ['almond', 'walnut', 'pecan', 'cashew', 'pistachio'],
-            'peanuts': ['peanut', 'peanuts'],
-            'wheat': ['wheat', 'flour', 'bread', 'pasta', 'noodles'],
-            'soy': ['soy', 'tofu', 'soybean']
-        }
-        
-        for allergen, keywords in allergen_patterns.items():
-            if any(keyword in text_lower for keyword in keywords):
-                allergens.append(allergen)
-        
-        return allergens
+        return self.classify_text(text)[2]
 
 # Example usage
 if __name__ == "__main__":
     scraper = EnhancedMenuScraper()
     
-    # Test with a sample restaurant URL
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        
-        # Example restaurant URL (replace with actual URL)
-        test_url = "https://www.yelp.com/biz/some-restaurant"
-        
-        try:
-            result = scraper.enhanced_menu_detection(page, test_url)
-            print(json.dumps(result, indent=2))
-        except Exception as e:
-            print(f"Test failed: {e}")
-        finally:
-            browser.close()
\ No newline at end of file
+    # Example restaurant URL (replace with actual URL)
+    test_url = "https://www.yelp.com/biz/some-restaurant"
+    
+    try:
+        result = asyncio.run(scraper.scrape_many([test_url]))[0]
+        print(json.dumps(result, indent=2))
+    except Exception as e:
+        print(f"Test failed: {e}")
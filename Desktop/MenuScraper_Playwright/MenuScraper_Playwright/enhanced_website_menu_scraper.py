@@ -6,7 +6,9 @@ Uses known Chicago restaurant websites for real menu data extraction
 """
 
 import asyncio
+import bisect
 import json
+import os
 import re
 import time
 from datetime import datetime
@@ -14,6 +16,32 @@ from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 import random
+from collections import Counter, defaultdict
+from itertools import islice
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from operator import attrgetter
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
 
 try:
     from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeoutError
@@ -23,19 +51,292 @@ except ImportError:
 
 from enhanced_allergen_analyzer import AdvancedAllergenDetector, AllergenType, DietaryTag
 
+# Shared read-only default for missing nested summaries, instead of a fresh {} per lookup
+_EMPTY = MappingProxyType({})
+
+# The detector only holds static keyword tables, so every scraper shares one
+_ALLERGEN_DETECTOR = AdvancedAllergenDetector()
+
+@lru_cache(maxsize=4096)
+def _analyze_allergens(text: str, item_name: str):
+    """Memoized AdvancedAllergenDetector.analyze_allergens; chain menus and
+    recurring dishes repeat the same text across restaurants. The result is
+    shared between callers and must not be mutated"""
+    return _ALLERGEN_DETECTOR.analyze_allergens(text, item_name)
+
+# Patterns are compiled once at import instead of going through re's
+# pattern cache on every call inside the per-item loops
+# Price patterns, tried in order on each line of an item
+_PRICE_RES = [
+    re.compile(r'\$\d+(?:\.\d{2})?'),
+    re.compile(r'\d+(?:\.\d{2})?\s*(?:dollars?|usd|\$)'),
+    re.compile(r'\b\d{1,2}(?:\.\d{2})?\b(?=\s*(?:$|\n|\s))'),
+]
+
+_DOLLAR_PRICE_RE = re.compile(r'\$\d+(?:\.\d{2})?')
+
+# Navigation and non-food names, as one anchored alternation
+_INVALID_NAME_RE = re.compile('|'.join(f'(?:{p})' for p in [
+    r'^(home|about|contact|location|hours|reservation|order|cart|login|sign|register)$',
+    r'^(menu|food|drink|wine|beer|cocktail)$',
+    r'^(breakfast|lunch|dinner|appetizer|entree|dessert|beverage)$',
+    r'^(privacy|terms|policy|copyright|\d+)$',
+    r'^(facebook|twitter|instagram|yelp)$'
+]))
+
+# Food words that make a scraped name look like a menu item (substring match)
+FOOD_INDICATORS = [
+    'chicken', 'beef', 'pork', 'fish', 'salmon', 'tuna', 'shrimp', 'lobster',
+    'pasta', 'pizza', 'burger', 'sandwich', 'salad', 'soup', 'steak',
+    'cheese', 'bread', 'rice', 'noodle', 'vegetable', 'fruit', 'dessert',
+    'cake', 'pie', 'ice cream', 'chocolate', 'wine', 'beer', 'cocktail'
+]
+
+_FOOD_INDICATOR_RE = re.compile('|'.join(map(re.escape, FOOD_INDICATORS)))
+
+# Whole-word keywords behind each nutritional hint; 'spicy_level' counts
+# hits, every other hint is a flag
+NUTRITION_KEYWORDS = {
+    'likely_high_protein': ['protein', 'chicken', 'beef', 'fish', 'tofu', 'beans', 'lentils', 'quinoa', 'steak', 'salmon', 'tuna', 'shrimp', 'lobster'],
+    'likely_high_fat': ['fried', 'butter', 'oil', 'cream', 'cheese', 'avocado', 'nuts', 'bacon', 'sausage'],
+    'likely_high_carb': ['pasta', 'rice', 'bread', 'potato', 'noodles', 'flour', 'pizza', 'sandwich'],
+    'likely_high_fiber': ['beans', 'lentils', 'quinoa', 'oats', 'vegetables', 'whole grain', 'salad', 'spinach', 'kale'],
+    'likely_low_calorie': ['salad', 'steamed', 'grilled', 'light', 'fresh', 'raw', 'vegetable', 'fruit'],
+    'contains_vegetables': ['vegetables', 'veggie', 'lettuce', 'tomato', 'onion', 'pepper', 'spinach', 'kale', 'broccoli', 'carrot'],
+    'contains_fruits': ['apple', 'banana', 'berry', 'citrus', 'fruit', 'orange', 'strawberry', 'mango', 'pineapple'],
+    'spicy_level': ['spicy', 'hot', 'jalapeño', 'habanero', 'sriracha', 'chili', 'pepper', 'cayenne'],
+}
+
+_NUTRITION_RES = {
+    hint: re.compile(r'\b(' + '|'.join(keywords) + r')\b')
+    for hint, keywords in NUTRITION_KEYWORDS.items()
+}
+
+def _build_nutrition_automaton():
+    """One automaton over every nutrition keyword; each word maps to all the
+    hints it belongs to ("pepper" is both a vegetable and spicy)"""
+    hints = {}
+    for hint, keywords in NUTRITION_KEYWORDS.items():
+        for keyword in keywords:
+            hints.setdefault(keyword, []).append(hint)
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, keyword_hints in hints.items():
+        automaton.add_word(keyword, (len(keyword), tuple(keyword_hints)))
+    automaton.make_automaton()
+    return automaton
+
+_NUTRITION_AUTOMATON = _build_nutrition_automaton() if AHOCORASICK_AVAILABLE else None
+
+# Every risk level an item can carry, in risk_distribution order
+_RISK_LEVELS = ('high', 'medium', 'low', 'unknown')
+
+# Restaurant risk by share of high-risk items: above 10% is medium, above
+# 30% high; None falls back to low/unknown from the risk distribution
+_RISK_THRESHOLDS = (10, 30)
+_RISK_LABELS = (None, 'medium', 'high')
+
+# Health-app readiness as (more than N menu items, more than N allergen
+# detections, label), best tier first
+_READINESS_TIERS = (
+    (80, 40, 'excellent'),
+    (40, 20, 'good'),
+    (15, -1, 'fair'),
+)
+
+def _percent(part: int, whole: int) -> float:
+    """part as a percentage of whole, to 2 decimals; 0 when whole is 0"""
+    return round((part / whole) * 100, 2) if whole > 0 else 0
+
+def _is_word_char(char: str) -> bool:
+    """Same characters as the regex \\w class"""
+    return char.isalnum() or char == '_'
+
+@dataclass
+class MenuItem:
+    """One analysed menu item; results are turned into dicts only once a
+    scrape is finished"""
+    __slots__ = ('name', 'description', 'price', 'restaurant_name', 'restaurant_categories',
+                 'allergen_analysis', 'preparation_methods', 'nutritional_hints',
+                 'confidence_score', 'extraction_timestamp')
+    name: str
+    description: str
+    price: Optional[str]
+    restaurant_name: str
+    restaurant_categories: List[str]
+    allergen_analysis: Dict[str, Any]
+    preparation_methods: List[str]
+    nutritional_hints: Dict[str, Any]
+    confidence_score: float
+    extraction_timestamp: str
+
+# Per-item analysis is plain module-level code so that it can run in a
+# worker process as well as in the scraper
+
+# Fields copied into each row of scrape_restaurant_menu's "items"
+_MENU_ROW_FIELDS = attrgetter('name', 'price', 'description', 'allergen_analysis')
+
+def _empty_menu_result(url: str) -> Dict[str, Any]:
+    """A fresh scrape_restaurant_menu result with nothing extracted; every
+    outcome fills in its own fields on top, keeping the key order stable"""
+    return {
+        "url": url,
+        "success": False,
+        "items": [],
+        "total_items": 0,
+        "processing_time": 0,
+        "extraction_method": None,
+        "allergen_summary": {},
+        "price_coverage": 0,
+        "menu_image_urls": [],
+        "ocr_texts": [],
+        "error": None
+    }
+
+def _enhance_item(item: Dict[str, Any], restaurant_name: str, restaurant_categories: List[str]) -> MenuItem:
+    """Enhance menu item with comprehensive allergen analysis"""
+    # Combine all text for analysis; raw_text is only needed here, so
+    # it is released from the scraped item rather than kept until the
+    # whole restaurant is processed
+    analysis_text = f"{item.get('name', '')} {item.get('description', '')} {item.pop('raw_text', '')}"
+    
+    # Perform allergen analysis
+    allergen_analysis = _analyze_allergens(analysis_text, item.get('name', ''))
+    
+    # Detect preparation methods
+    prep_methods = _ALLERGEN_DETECTOR.detect_preparation_methods(analysis_text)
+    
+    # Extract nutritional hints
+    nutritional_hints = _nutritional_hints(analysis_text)
+    
+    # Calculate confidence score
+    confidence_score = _confidence_score(allergen_analysis, item)
+    
+    return MenuItem(
+        name=item.get('name', ''),
+        description=item.get('description', ''),
+        price=item.get('price'),
+        restaurant_name=restaurant_name,
+        restaurant_categories=restaurant_categories,
+        allergen_analysis={
+            'detected_allergens': [a.value for a in allergen_analysis.detected_allergens],
+            'confidence_scores': dict(allergen_analysis.confidence_scores),
+            'dietary_tags': [tag.value for tag in allergen_analysis.dietary_tags],
+            'risk_level': allergen_analysis.risk_level,
+            'safe_for_allergies': [a.value for a in allergen_analysis.safe_for_allergies],
+            'warnings': list(allergen_analysis.warnings)
+        },
+        preparation_methods=prep_methods,
+        nutritional_hints=nutritional_hints,
+        confidence_score=confidence_score,
+        extraction_timestamp=datetime.now().isoformat()
+    )
+
+def _nutritional_hints(text: str) -> Dict[str, Any]:
+    """Extract nutritional hints from text"""
+    text_lower = text.lower()
+    
+    if _NUTRITION_AUTOMATON is None:
+        hints = {
+            hint: bool(hint_re.search(text_lower))
+            for hint, hint_re in _NUTRITION_RES.items()
+        }
+        hints['spicy_level'] = len(_NUTRITION_RES['spicy_level'].findall(text_lower))
+        return hints
+    
+    # One automaton pass; a hit only counts as a whole word, as with \b
+    hints = dict.fromkeys(NUTRITION_KEYWORDS, False)
+    hints['spicy_level'] = 0
+    last = len(text_lower) - 1
+    for end_index, (length, keyword_hints) in _NUTRITION_AUTOMATON.iter(text_lower):
+        start_index = end_index - length + 1
+        if start_index > 0 and _is_word_char(text_lower[start_index - 1]):
+            continue
+        if end_index < last and _is_word_char(text_lower[end_index + 1]):
+            continue
+        for hint in keyword_hints:
+            if hint == 'spicy_level':
+                hints[hint] += 1
+            else:
+                hints[hint] = True
+    return hints
+
+def _confidence_score(allergen_analysis, item: Dict[str, Any]) -> float:
+    """Calculate confidence score for menu item analysis"""
+    base_score = 0.6
+    
+    # Boost confidence based on available data
+    if item.get('description') and len(item['description']) > 20:
+        base_score += 0.2
+    
+    if item.get('name') and len(item['name']) > 5:
+        base_score += 0.1
+    
+    if item.get('price'):
+        base_score += 0.1
+    
+    # Adjust based on allergen detection confidence
+    if allergen_analysis.confidence_scores:
+        avg_allergen_confidence = sum(allergen_analysis.confidence_scores.values()) / len(allergen_analysis.confidence_scores)
+        base_score = (base_score + avg_allergen_confidence) / 2
+    
+    return min(base_score, 1.0)
+
+def _enhance_items(items: List[Dict[str, Any]], restaurant_name: str, restaurant_categories: List[str]) -> List[MenuItem]:
+    """Enhance one restaurant's menu items; the unit of work sent to the
+    analysis process pool"""
+    return [_enhance_item(item, restaurant_name, restaurant_categories) for item in items]
+
 class EnhancedWebsiteMenuScraper:
-    """Enhanced menu scraper targeting actual restaurant websites"""
+    """Enhanced menu scraper targeting actual restaurant websites
+    
+    With block_resources the browser contexts abort image, font, media and
+    stylesheet requests. Extraction only reads textContent and class-based
+    selectors, so none of those change what is scraped, while they make up
+    most of a restaurant site's bytes.
+    
+    Used as `async with EnhancedWebsiteMenuScraper() as scraper:`, the
+    browser is launched once and stays warm across scrape calls; otherwise
+    each call launches and closes its own.
+    """
+    
+    BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+    
+    # Minimum seconds between two visits to the same host
+    HOST_MIN_INTERVAL = 3.0
+    
+    # Warm pages kept by `async with`, one per concurrent scrape
+    POOL_SIZE = 5
     
-    def __init__(self, headless: bool = True, timeout: int = 30000, proxy: Optional[str] = None):
+    # How often each menu selector produced the accepted items, across runs;
+    # menu_selectors are tried most successful first
+    SELECTOR_STATS_PATH = os.path.join(os.path.expanduser('~'), '.menuscraper', 'website_selector_stats.json')
+    
+    def __init__(self, headless: bool = True, timeout: int = 30000, proxy: Optional[str] = None,
+                 block_resources: bool = True, analysis_workers: int = 1,
+                 selector_stats_path: Optional[str] = SELECTOR_STATS_PATH):
         self.headless = headless
         self.timeout = timeout
         self.proxy = proxy
+        self.block_resources = block_resources
+        # Menu item analysis runs in a process pool of this size, created on
+        # first use; 1 or fewer analyses in-process
+        self.analysis_workers = analysis_workers
+        self._analysis_pool: Optional[ProcessPoolExecutor] = None
+        self.playwright = None
         self.browser: Optional[Browser] = None
         self.context = None
-        self.allergen_detector = AdvancedAllergenDetector()
+        # Warm pages (one per context) handed out to concurrent scrapes
+        self._page_pool: Optional[asyncio.Queue] = None
+        self.allergen_detector = _ALLERGEN_DETECTOR
         self.output_dir = Path("output")
         self.output_dir.mkdir(exist_ok=True)
         
+        # Per-host politeness: when each host was last visited, and a lock
+        # so concurrent scrapes of the same host take turns
+        self._host_locks = defaultdict(asyncio.Lock)
+        self._host_last_visit: Dict[str, float] = {}
+        
         # Enhanced menu detection selectors for restaurant websites
         self.menu_selectors = [
             # Common menu item patterns
@@ -64,18 +365,45 @@ class EnhancedWebsiteMenuScraper:
             '[class*="menu-card"]', '[class*="food-card"]'
         ]
         
+        # Try the historically most successful selectors first; the sort is
+        # stable, so untried selectors keep their order above
+        self.selector_stats_path = selector_stats_path
+        self._selector_stats = self._load_selector_stats()
+        self._selector_stats_dirty = False
+        self.menu_selectors.sort(key=lambda selector: -self._selector_stats.get(selector, 0))
+        
+        # Selectors whose appearance means menu items have rendered; after
+        # navigation we wait for the first of them instead of network idle
+        self.menu_ready_selectors = [
+            '.menu-item', '.food-item', '.dish-item', '.product-item',
+            '.menu-section-item', '.menu-list-item', '.dish',
+            '[class*="menu-item"]', '[class*="food-item"]'
+        ]
+        
         # Menu page indicators
         self.menu_indicators = [
             'menu', 'food', 'dine', 'eat', 'order', 'cuisine',
             'breakfast', 'lunch', 'dinner', 'specials', 'dishes'
         ]
+        self._menu_indicator_re = re.compile('|'.join(map(re.escape, self.menu_indicators)))
+        
+        # Menu link selectors in priority order, built once; dict.fromkeys
+        # drops the repeated '.menu a' without changing which match wins
+        self._menu_link_selectors = list(dict.fromkeys(
+            selector
+            for indicator in self.menu_indicators
+            for selector in (
+                f'a[href*="{indicator}"]',
+                f'a:has-text("{indicator}")',
+                f'button:has-text("{indicator}")',
+                f'[class*="{indicator}"] a',
+                f'nav a:has-text("{indicator}")',
+                f'.menu a', f'.navigation a:has-text("{indicator}")'
+            )
+        ))
         
         # Price patterns
-        self.price_patterns = [
-            r'\$\d+(?:\.\d{2})?',
-            r'\d+(?:\.\d{2})?\s*(?:dollars?|usd|\$)',
-            r'\b\d{1,2}(?:\.\d{2})?\b(?=\s*(?:$|\n|\s))',
-        ]
+        self.price_patterns = _PRICE_RES
         
         # Chicago restaurants with known websites
         self.chicago_restaurants = [
@@ -141,10 +469,15 @@ class EnhancedWebsiteMenuScraper:
             }
         ]
     
-    async def setup_browser(self) -> bool:
-        """Setup browser with enhanced stealth configuration and proxy support"""
+    async def setup_browser(self, pool_size: int = 1) -> bool:
+        """Setup browser with enhanced stealth configuration and proxy support
+        
+        Creates `pool_size` contexts with one page each; scrapes borrow a page
+        from the pool and hand it back reset, instead of opening and closing
+        a page per restaurant.
+        """
         try:
-            playwright = await async_playwright().start()
+            self.playwright = await async_playwright().start()
             
             # Browser launch arguments
             launch_args = [
@@ -162,7 +495,7 @@ class EnhancedWebsiteMenuScraper:
                 launch_args.append(f'--proxy-server={self.proxy}')
                 print(f"🌐 Using proxy: {self.proxy}")
             
-            self.browser = await playwright.chromium.launch(
+            self.browser = await self.playwright.chromium.launch(
                 headless=self.headless,
                 args=launch_args
             )
@@ -179,16 +512,121 @@ class EnhancedWebsiteMenuScraper:
             if self.proxy:
                 context_config['proxy'] = {'server': self.proxy}
             
-            self.context = await self.browser.new_context(**context_config)
+            pages = []
+            for _ in range(max(1, pool_size)):
+                context = await self.browser.new_context(**context_config)
+                if self.block_resources:
+                    await context.route('**/*', self._route_request)
+                pages.append(await context.new_page())
+            self.context = pages[0].context
+            self._page_pool = asyncio.Queue()
+            for page in pages:
+                self._page_pool.put_nowait(page)
+            
+            await self._validate_selectors(pages[0])
             
             return True
             
         except Exception as e:
             print(f"❌ Browser setup failed: {e}")
+            await self.close()
             return False
     
-    async def scrape_enhanced_menus(self, max_restaurants: int = 8) -> Dict[str, Any]:
-        """Scrape menus from actual restaurant websites"""
+    async def _validate_selectors(self, page: Page):
+        """Drop selectors the browser cannot parse, once per setup, so the
+        per-page selector walks need no error handling of their own
+        
+        A Playwright-only :has-text("...") suffix is checked by its CSS part,
+        which is all the walks hand to querySelectorAll.
+        """
+        try:
+            valid = await page.evaluate(
+                """(sels) => sels.map(sel => {
+                    const hasText = sel.match(/^(.*):has-text\\("(.*)"\\)$/);
+                    try {
+                        document.querySelector(hasText ? hasText[1] : sel);
+                        return true;
+                    } catch (e) {
+                        return false;
+                    }
+                })""",
+                self.menu_selectors + self._menu_link_selectors
+            )
+        except Exception as e:
+            print(f"   ⚠️ Could not validate selectors: {e}")
+            return
+        
+        menu_valid = valid[:len(self.menu_selectors)]
+        link_valid = valid[len(self.menu_selectors):]
+        self.menu_selectors = [sel for sel, ok in zip(self.menu_selectors, menu_valid) if ok]
+        self._menu_link_selectors = [sel for sel, ok in zip(self._menu_link_selectors, link_valid) if ok]
+    
+    def _load_selector_stats(self) -> Dict[str, int]:
+        """Read the persisted selector hit counts, or start empty"""
+        if not self.selector_stats_path:
+            return {}
+        try:
+            with open(self.selector_stats_path, 'r', encoding='utf-8') as f:
+                stats = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(stats, dict):
+            return {}
+        return {selector: count for selector, count in stats.items() if isinstance(count, int)}
+    
+    def _save_selector_stats(self):
+        """Persist the selector hit counts if they changed, most successful first"""
+        if not self.selector_stats_path or not self._selector_stats_dirty:
+            return
+        # Write a private temp file and swap it in, so concurrent scrapers
+        # never see (or interleave into) a half-written file
+        tmp_path = f"{self.selector_stats_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.selector_stats_path) or '.', exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(dict(Counter(self._selector_stats).most_common()), f, indent=2)
+            os.replace(tmp_path, self.selector_stats_path)
+        except OSError as e:
+            print(f"⚠️ Could not save selector stats: {e}")
+            return
+        self._selector_stats_dirty = False
+    
+    async def close(self):
+        """Close the browser and stop Playwright, and save the selector stats"""
+        self._save_selector_stats()
+        if self.browser:
+            try:
+                await self.browser.close()
+            except Exception:
+                pass
+        if self.playwright:
+            await self.playwright.stop()
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self._page_pool = None
+        if self._analysis_pool is not None:
+            self._analysis_pool.shutdown()
+            self._analysis_pool = None
+    
+    async def __aenter__(self):
+        """Launch the browser once for every scrape made inside the block"""
+        if not await self.setup_browser(pool_size=self.POOL_SIZE):
+            raise RuntimeError("Browser setup failed")
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    
+    async def _route_request(self, route):
+        """Abort images, fonts, media and stylesheets; let everything else through"""
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def scrape_enhanced_menus(self, max_restaurants: int = 8, max_concurrency: int = 5) -> Dict[str, Any]:
+        """Scrape menus from actual restaurant websites, up to `max_concurrency` at a time"""
         print("🍽️ ENHANCED WEBSITE MENU SCRAPER")
         print("=" * 60)
         print(f"🎯 Target: {max_restaurants} Chicago restaurants")
@@ -196,28 +634,33 @@ class EnhancedWebsiteMenuScraper:
         print(f"🔬 Focus: Real menu extraction + comprehensive allergen analysis")
         print()
         
-        # Setup browser
-        if not await self.setup_browser():
+        # Setup browser, unless one is already warm
+        owns_browser = self.browser is None
+        if owns_browser and not await self.setup_browser(pool_size=max_concurrency):
             return {}
         
         try:
             # Get restaurant data
             restaurants_data = self.chicago_restaurants[:max_restaurants]
             
-            enhanced_restaurants = []
-            processed_count = 0
+            # Process restaurants concurrently; results keep input order
+            semaphore = asyncio.Semaphore(max(1, max_concurrency))
+            
+            async def scrape_bounded(i: int, restaurant: Dict[str, Any]) -> Dict[str, Any]:
+                async with self._host_slot(restaurant.get('website', ''), semaphore):
+                    print(f"\n🏪 [{i+1}/{len(restaurants_data)}] Processing: {restaurant.get('name', 'Unknown')}")
+                    print(f"   📍 Location: {restaurant.get('location', 'Unknown')}")
+                    return await self._scrape_restaurant_website(restaurant)
+            
+            enhanced_restaurants = list(await asyncio.gather(
+                *(scrape_bounded(i, restaurant) for i, restaurant in enumerate(restaurants_data))
+            ))
+            processed_count = len(enhanced_restaurants)
             success_count = 0
             total_menu_items = 0
             
-            # Process restaurants
-            for i, restaurant in enumerate(restaurants_data):
-                print(f"\n🏪 [{i+1}/{len(restaurants_data)}] Processing: {restaurant.get('name', 'Unknown')}")
-                print(f"   📍 Location: {restaurant.get('location', 'Unknown')}")
-                
-                enhanced_restaurant = await self._scrape_restaurant_website(restaurant)
-                enhanced_restaurants.append(enhanced_restaurant)
-                processed_count += 1
-                
+            for enhanced_restaurant in enhanced_restaurants:
+                print(f"\n🏪 {enhanced_restaurant.get('name', 'Unknown')}")
                 if enhanced_restaurant.get('menu_extraction_success', False):
                     success_count += 1
                     menu_items = enhanced_restaurant.get('enhanced_menu_items', [])
@@ -225,21 +668,25 @@ class EnhancedWebsiteMenuScraper:
                     print(f"   ✅ Success: {len(menu_items)} menu items extracted")
                     
                     # Show sample allergen detections
-                    allergen_items = [item for item in menu_items if item.get('allergen_analysis', {}).get('detected_allergens')]
+                    allergen_items = [item for item in menu_items if item.allergen_analysis.get('detected_allergens')]
                     if allergen_items:
                         print(f"   🔬 Allergens detected in {len(allergen_items)} items")
                         sample_item = allergen_items[0]
-                        allergens = sample_item['allergen_analysis']['detected_allergens']
-                        print(f"   📋 Sample: '{sample_item['name']}' contains {', '.join(allergens)}")
+                        allergens = sample_item.allergen_analysis['detected_allergens']
+                        print(f"   📋 Sample: '{sample_item.name}' contains {', '.join(allergens)}")
                 else:
                     print(f"   ❌ Failed: {enhanced_restaurant.get('extraction_error', 'Unknown error')}")
-                
-                # Add delay between requests
-                await asyncio.sleep(random.uniform(3, 6))
             
             # Generate comprehensive analysis
             analysis_summary = self._generate_comprehensive_analysis(enhanced_restaurants)
             
+            # Menu items stay MenuItem objects during the run and become
+            # plain dicts only in the returned and saved data
+            for enhanced_restaurant in enhanced_restaurants:
+                enhanced_restaurant['enhanced_menu_items'] = [
+                    asdict(item) for item in enhanced_restaurant['enhanced_menu_items']
+                ]
+            
             # Create final dataset
             comprehensive_data = {
                 "scraping_summary": {
@@ -247,7 +694,7 @@ class EnhancedWebsiteMenuScraper:
                     "source_type": "chicago_restaurant_websites",
                     "restaurants_processed": processed_count,
                     "successful_extractions": success_count,
-                    "success_rate_percent": round((success_count / processed_count) * 100, 2) if processed_count > 0 else 0,
+                    "success_rate_percent": _percent(success_count, processed_count),
                     "total_menu_items_extracted": total_menu_items,
                     "average_items_per_restaurant": round(total_menu_items / success_count, 2) if success_count > 0 else 0,
                     "features": [
@@ -270,13 +717,28 @@ class EnhancedWebsiteMenuScraper:
             output_file = f"chicago_enhanced_website_menu_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             output_path = self.output_dir / output_file
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(comprehensive_data, f, indent=2, ensure_ascii=False, default=str)
+            if ORJSON_AVAILABLE:
+                # Serialized in C straight to UTF-8 bytes; datetimes are passed
+                # through to default=str so the output matches the json path
+                output_bytes = orjson.dumps(
+                    comprehensive_data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+                    default=str
+                )
+            else:
+                output_bytes = json.dumps(comprehensive_data, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+            
+            # Write off the event loop so the browser teardown overlaps the disk I/O
+            if AIOFILES_AVAILABLE:
+                async with aiofiles.open(output_path, 'wb') as f:
+                    await f.write(output_bytes)
+            else:
+                await asyncio.get_running_loop().run_in_executor(None, output_path.write_bytes, output_bytes)
             
             print(f"\n✅ Enhanced menu data saved to: {output_file}")
             print(f"\n📊 FINAL SUMMARY:")
             print(f"   • Restaurants processed: {processed_count}")
-            print(f"   • Successful extractions: {success_count} ({round((success_count / processed_count) * 100, 2)}%)")
+            print(f"   • Successful extractions: {success_count} ({comprehensive_data['scraping_summary']['success_rate_percent']}%)")
             print(f"   • Total menu items: {total_menu_items}")
             print(f"   • Allergen detections: {analysis_summary['allergen_analysis']['total_allergen_detections']}")
             print(f"   • High-risk items: {analysis_summary['allergen_analysis']['high_risk_items']}")
@@ -286,28 +748,58 @@ class EnhancedWebsiteMenuScraper:
             return comprehensive_data
             
         finally:
-            if self.browser:
-                await self.browser.close()
+            if owns_browser:
+                await self.close()
+    
+    @asynccontextmanager
+    async def _host_slot(self, url: str, semaphore: asyncio.Semaphore):
+        """Hold one of the `semaphore` slots, entered only once the last visit
+        to this URL's host is HOST_MIN_INTERVAL to twice that many seconds old
+        (randomised, as the old delay was)
+        
+        Replaces a blanket delay after every restaurant, so concurrent
+        scrapes of different hosts never wait on each other. The host's
+        interval is waited out before taking a slot, so a scrape parked on a
+        busy host does not hold one up, and the visit is stamped once the
+        slot is taken, when it actually starts.
+        """
+        host = urlparse(url).netloc
+        if not host:
+            async with semaphore:
+                yield
+            return
+        
+        async with self._host_locks[host]:
+            last_visit = self._host_last_visit.get(host)
+            if last_visit is not None:
+                wait = last_visit + self.HOST_MIN_INTERVAL * random.uniform(1, 2) - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            await semaphore.acquire()
+            self._host_last_visit[host] = time.monotonic()
+        try:
+            yield
+        finally:
+            semaphore.release()
     
     async def _scrape_restaurant_website(self, restaurant: Dict[str, Any]) -> Dict[str, Any]:
         """Scrape menu from restaurant's actual website"""
         enhanced_restaurant = restaurant.copy()
         
+        # Get restaurant website
+        website_url = restaurant.get('website', '')
+        if not website_url:
+            enhanced_restaurant.update({
+                'menu_extraction_success': False,
+                'extraction_error': 'No website URL provided',
+                'enhanced_menu_items': []
+            })
+            return enhanced_restaurant
+        
+        page = await self._page_pool.get()
         try:
-            page = await self.context.new_page()
-            
-            # Get restaurant website
-            website_url = restaurant.get('website', '')
-            if not website_url:
-                enhanced_restaurant.update({
-                    'menu_extraction_success': False,
-                    'extraction_error': 'No website URL provided',
-                    'enhanced_menu_items': []
-                })
-                return enhanced_restaurant
-            
             print(f"   🌐 Navigating to: {website_url}")
-            await page.goto(website_url, wait_until='networkidle', timeout=self.timeout)
+            await self._goto(page, website_url)
             
             # Look for menu section or navigate to menu page
             menu_items = await self._extract_website_menu_items(page, website_url)
@@ -317,14 +809,11 @@ class EnhancedWebsiteMenuScraper:
                 menu_url = await self._find_menu_page(page, website_url)
                 if menu_url:
                     print(f"   📋 Found menu page: {menu_url}")
-                    await page.goto(menu_url, wait_until='networkidle', timeout=self.timeout)
+                    await self._goto(page, menu_url)
                     menu_items = await self._extract_website_menu_items(page, menu_url)
             
             # Process extracted menu items
-            enhanced_menu_items = []
-            for item in menu_items:
-                enhanced_item = await self._enhance_menu_item(item, restaurant)
-                enhanced_menu_items.append(enhanced_item)
+            enhanced_menu_items = await self._enhance_menu_items(menu_items, restaurant)
             
             # Add restaurant-level analysis
             restaurant_analysis = self._analyze_restaurant_allergens(restaurant, enhanced_menu_items)
@@ -338,7 +827,6 @@ class EnhancedWebsiteMenuScraper:
                 'menu_extraction_timestamp': datetime.now().isoformat()
             })
             
-            await page.close()
             return enhanced_restaurant
             
         except Exception as e:
@@ -349,32 +837,72 @@ class EnhancedWebsiteMenuScraper:
                 'enhanced_menu_items': []
             })
             return enhanced_restaurant
+        
+        finally:
+            await self._page_pool.put(await self._reset_page(page))
+    
+    async def _reset_page(self, page: Page) -> Page:
+        """Blank a borrowed page and drop its site's cookies before it goes
+        back to the pool; a page that crashed or closed is replaced (or, if
+        even that fails, returned as is so the pool never shrinks)"""
+        context = page.context
+        try:
+            await context.clear_cookies()
+            if not page.is_closed():
+                await page.goto('about:blank')
+                return page
+        except Exception:
+            pass
+        try:
+            await page.close()
+        except Exception:
+            pass
+        try:
+            return await context.new_page()
+        except Exception:
+            return page
+    
+    async def _goto(self, page: Page, url: str):
+        """Navigate, then wait for menu items to render rather than for the
+        network to go idle, which analytics-heavy sites may never do
+        
+        If no menu selector appears within 8 seconds, extraction runs on
+        whatever has rendered by then.
+        """
+        await page.goto(url, wait_until='domcontentloaded', timeout=self.timeout)
+        try:
+            await page.wait_for_selector(', '.join(self.menu_ready_selectors), state='attached', timeout=8000)
+        except Exception:
+            pass
     
     async def _find_menu_page(self, page: Page, base_url: str) -> Optional[str]:
         """Find menu page on restaurant website"""
         try:
-            # Look for menu links
-            for indicator in self.menu_indicators:
-                selectors = [
-                    f'a[href*="{indicator}"]',
-                    f'a:has-text("{indicator}")',
-                    f'button:has-text("{indicator}")',
-                    f'[class*="{indicator}"] a',
-                    f'nav a:has-text("{indicator}")',
-                    f'.menu a', f'.navigation a:has-text("{indicator}")'
-                ]
-                
-                for selector in selectors:
-                    try:
-                        element = await page.query_selector(selector)
-                        if element:
-                            href = await element.get_attribute('href')
-                            if href:
-                                full_url = urljoin(base_url, href)
-                                if self._is_menu_url(full_url):
-                                    return full_url
-                    except:
-                        continue
+            # Look for menu links: read the first match's href for every
+            # selector in one round-trip; the Playwright-only :has-text("...")
+            # suffix is applied as a case-insensitive text filter
+            hrefs = await page.evaluate(
+                """(sels) => sels.map(sel => {
+                    const hasText = sel.match(/^(.*):has-text\\("(.*)"\\)$/);
+                    let els = Array.from(document.querySelectorAll(hasText ? hasText[1] : sel));
+                    if (hasText) {
+                        const needle = hasText[2].toLowerCase();
+                        els = els.filter(e => (e.textContent || '').replace(/\\s+/g, ' ').toLowerCase().includes(needle));
+                    }
+                    return els.length ? els[0].getAttribute('href') : null;
+                })""",
+                self._menu_link_selectors
+            )
+            
+            # Several selectors usually hit the same link; join and check
+            # each distinct href once
+            checked = set()
+            for href in hrefs:
+                if href and href not in checked:
+                    checked.add(href)
+                    full_url = urljoin(base_url, href)
+                    if self._is_menu_url(full_url):
+                        return full_url
             
             return None
             
@@ -385,39 +913,65 @@ class EnhancedWebsiteMenuScraper:
     def _is_menu_url(self, url: str) -> bool:
         """Check if URL is likely a menu page"""
         url_lower = url.lower()
-        return any(indicator in url_lower for indicator in self.menu_indicators)
+        return self._menu_indicator_re.search(url_lower) is not None
     
     async def _extract_website_menu_items(self, page: Page, url: str) -> List[Dict[str, Any]]:
         """Extract menu items from restaurant website"""
         menu_items = []
         
         try:
-            # Wait for content to load
-            await asyncio.sleep(3)
-            
-            # Try different menu extraction strategies
-            for selector in self.menu_selectors:
+            # Try different menu extraction strategies. Each evaluate returns
+            # the first selector (from `start`) with at least 3 matches and
+            # the text of its first 30 elements, so a page costs one
+            # round-trip unless too few of those turn out to be valid items.
+            # Once no selector is left, it returns the body text instead for
+            # the text-based fallback
+            body_text = None
+            start = 0
+            while start < len(self.menu_selectors):
                 try:
-                    elements = await page.query_selector_all(selector)
-                    if elements and len(elements) >= 3:  # Minimum threshold
-                        print(f"   📋 Found {len(elements)} items with selector: {selector}")
-                        
-                        valid_items = []
-                        for element in elements[:30]:  # Limit to prevent overwhelming data
-                            item_data = await self._extract_item_data(element)
-                            if item_data and self._is_valid_menu_item(item_data):
-                                valid_items.append(item_data)
-                        
-                        if len(valid_items) >= 3:  # Need at least 3 valid items
-                            menu_items = valid_items
-                            break
-                            
-                except Exception as e:
-                    continue
+                    found = await page.evaluate(
+                        """({sels, start}) => {
+                            for (let i = start; i < sels.length; i++) {
+                                const hasText = sels[i].match(/^(.*):has-text\\("(.*)"\\)$/);
+                                let els = Array.from(document.querySelectorAll(hasText ? hasText[1] : sels[i]));
+                                if (hasText) {
+                                    const needle = hasText[2].toLowerCase();
+                                    els = els.filter(e => (e.textContent || '').replace(/\\s+/g, ' ').toLowerCase().includes(needle));
+                                }
+                                if (els.length >= 3) {  // Minimum threshold
+                                    return {index: i, count: els.length, texts: els.slice(0, 30).map(e => e.textContent)};
+                                }
+                            }
+                            return {index: -1, body: document.body ? document.body.textContent : ''};
+                        }""",
+                        {'sels': self.menu_selectors, 'start': start}
+                    )
+                except Exception:
+                    break
+                if found['index'] < 0:
+                    body_text = found['body']
+                    break
+                start = found['index'] + 1
+                
+                print(f"   📋 Found {found['count']} items with selector: {self.menu_selectors[found['index']]}")
+                
+                valid_items = []
+                for text_content in found['texts']:  # Limit to prevent overwhelming data
+                    item_data = self._parse_item_text(text_content)
+                    if item_data and self._is_valid_menu_item(item_data):
+                        valid_items.append(item_data)
+                
+                if len(valid_items) >= 3:  # Need at least 3 valid items
+                    menu_items = valid_items
+                    selector = self.menu_selectors[found['index']]
+                    self._selector_stats[selector] = self._selector_stats.get(selector, 0) + 1
+                    self._selector_stats_dirty = True
+                    break
             
             # If no structured menu found, try text-based extraction
             if not menu_items:
-                menu_items = await self._extract_text_based_menu(page)
+                menu_items = await self._extract_text_based_menu(page, body_text)
             
             return menu_items[:25]  # Limit to 25 items per restaurant
             
@@ -430,42 +984,26 @@ class EnhancedWebsiteMenuScraper:
         name = item.get('name', '').strip()
         
         # Filter out navigation and non-food items
-        invalid_patterns = [
-            r'^(home|about|contact|location|hours|reservation|order|cart|login|sign|register)$',
-            r'^(menu|food|drink|wine|beer|cocktail)$',
-            r'^(breakfast|lunch|dinner|appetizer|entree|dessert|beverage)$',
-            r'^(privacy|terms|policy|copyright|\d+)$',
-            r'^(facebook|twitter|instagram|yelp)$'
-        ]
-        
         name_lower = name.lower()
-        for pattern in invalid_patterns:
-            if re.match(pattern, name_lower):
-                return False
+        if _INVALID_NAME_RE.match(name_lower):
+            return False
         
         # Must have reasonable length
         if len(name) < 3 or len(name) > 100:
             return False
         
         # Should contain food-related words or have a price
-        food_indicators = [
-            'chicken', 'beef', 'pork', 'fish', 'salmon', 'tuna', 'shrimp', 'lobster',
-            'pasta', 'pizza', 'burger', 'sandwich', 'salad', 'soup', 'steak',
-            'cheese', 'bread', 'rice', 'noodle', 'vegetable', 'fruit', 'dessert',
-            'cake', 'pie', 'ice cream', 'chocolate', 'wine', 'beer', 'cocktail'
-        ]
+        if item.get('price'):
+            return True
+        if _FOOD_INDICATOR_RE.search(name_lower):
+            return True
         
-        has_food_indicator = any(indicator in name_lower for indicator in food_indicators)
-        has_price = bool(item.get('price'))
         has_description = bool(item.get('description', '').strip())
-        
-        return has_food_indicator or has_price or (has_description and len(item['description']) > 10)
+        return has_description and len(item['description']) > 10
     
-    async def _extract_item_data(self, element) -> Dict[str, Any]:
-        """Extract data from individual menu item element"""
+    def _parse_item_text(self, text_content: str) -> Dict[str, Any]:
+        """Extract data from the text of an individual menu item element"""
         try:
-            # Get text content
-            text_content = await element.text_content()
             if not text_content or len(text_content.strip()) < 3:
                 return {}
             
@@ -479,7 +1017,7 @@ class EnhancedWebsiteMenuScraper:
             price_line_idx = -1
             for i, line in enumerate(lines):
                 for pattern in self.price_patterns:
-                    match = re.search(pattern, line)
+                    match = pattern.search(line)
                     if match:
                         price = match.group()
                         price_line_idx = i
@@ -506,7 +1044,7 @@ class EnhancedWebsiteMenuScraper:
             
             return {
                 'name': name[:100],  # Limit length
-                'description': description[:300],  # Limit length
+                'description': description[:200],  # Limit length
                 'price': price,
                 'raw_text': text_content[:200]  # Keep raw text for analysis
             }
@@ -514,37 +1052,35 @@ class EnhancedWebsiteMenuScraper:
         except Exception as e:
             return {}
     
-    async def _extract_text_based_menu(self, page: Page) -> List[Dict[str, Any]]:
-        """Extract menu items using text-based patterns"""
+    async def _extract_text_based_menu(self, page: Page, page_text: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Extract menu items using text-based patterns, from `page_text` if
+        the body text was already read"""
         try:
             # Get page text
-            page_text = await page.text_content('body')
+            if page_text is None:
+                page_text = await page.text_content('body')
             if not page_text:
                 return []
             
             menu_items = []
             
-            # Look for price patterns and extract surrounding text
-            price_pattern = r'\$\d+(?:\.\d{2})?'
-            matches = list(re.finditer(price_pattern, page_text))
-            
-            for match in matches[:15]:  # Limit to 15 items
+            # Look for price patterns and extract surrounding text, slicing
+            # around each match's own position
+            for match in islice(_DOLLAR_PRICE_RE.finditer(page_text), 15):  # Limit to 15 items
                 price = match.group()
                 start = max(0, match.start() - 150)
                 end = min(len(page_text), match.end() + 150)
                 context = page_text[start:end]
                 
-                # Extract potential item name (text before price)
-                before_price = context[:context.find(price)]
-                lines = [line.strip() for line in before_price.split('\n') if line.strip()]
+                # Extract potential item name (last non-blank line before price)
+                before_price = page_text[start:match.start()]
+                name = before_price.rstrip().rpartition('\n')[2].strip()
                 
-                if lines:
-                    name = lines[-1]  # Last line before price is likely the name
+                if name:
                     if len(name) > 3 and len(name) < 80:  # Reasonable name length
-                        # Get description (text after price)
-                        after_price = context[context.find(price)+len(price):]
-                        desc_lines = [line.strip() for line in after_price.split('\n') if line.strip()]
-                        description = desc_lines[0] if desc_lines else ''
+                        # Get description (first non-blank line after price)
+                        after_price = page_text[match.end():end]
+                        description = after_price.lstrip().partition('\n')[0].strip()
                         
                         item = {
                             'name': name,
@@ -562,80 +1098,45 @@ class EnhancedWebsiteMenuScraper:
             print(f"   ❌ Error in text-based extraction: {e}")
             return []
     
-    async def _enhance_menu_item(self, item: Dict[str, Any], restaurant: Dict[str, Any]) -> Dict[str, Any]:
-        """Enhance menu item with comprehensive allergen analysis"""
-        # Combine all text for analysis
-        analysis_text = f"{item.get('name', '')} {item.get('description', '')} {item.get('raw_text', '')}"
-        
-        # Perform allergen analysis
-        allergen_analysis = self.allergen_detector.analyze_allergens(analysis_text, item.get('name', ''))
-        
-        # Detect preparation methods
-        prep_methods = self.allergen_detector.detect_preparation_methods(analysis_text)
-        
-        # Extract nutritional hints
-        nutritional_hints = self._extract_nutritional_hints(analysis_text)
-        
-        # Calculate confidence score
-        confidence_score = self._calculate_confidence_score(allergen_analysis, item)
+    async def _enhance_menu_items(self, items: List[Dict[str, Any]], restaurant: Dict[str, Any]) -> List[MenuItem]:
+        """Enhance a restaurant's menu items with comprehensive allergen analysis
         
-        return {
-            'name': item.get('name', ''),
-            'description': item.get('description', ''),
-            'price': item.get('price'),
-            'restaurant_name': restaurant.get('name', ''),
-            'restaurant_categories': restaurant.get('categories', []),
-            'allergen_analysis': {
-                'detected_allergens': [a.value for a in allergen_analysis.detected_allergens],
-                'confidence_scores': allergen_analysis.confidence_scores,
-                'dietary_tags': [tag.value for tag in allergen_analysis.dietary_tags],
-                'risk_level': allergen_analysis.risk_level,
-                'safe_for_allergies': [a.value for a in allergen_analysis.safe_for_allergies],
-                'warnings': allergen_analysis.warnings
-            },
-            'preparation_methods': prep_methods,
-            'nutritional_hints': nutritional_hints,
-            'confidence_score': confidence_score,
-            'extraction_timestamp': datetime.now().isoformat()
-        }
+        The analysis runs in-process by default: a restaurant is only a few
+        milliseconds of CPU, far less than starting worker processes, and the
+        memoized allergen analysis stays warm across restaurants. Long-lived
+        batch runs can opt in with analysis_workers > 1, which sends each
+        restaurant to a process pool as one batch (one round of pickling
+        instead of one per item), leaving the event loop free for the other
+        scrapes in flight.
+        """
+        restaurant_name = restaurant.get('name', '')
+        restaurant_categories = restaurant.get('categories', [])
+        if self.analysis_workers > 1 and len(items) > 1:
+            try:
+                if self._analysis_pool is None:
+                    self._analysis_pool = ProcessPoolExecutor(max_workers=self.analysis_workers)
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    self._analysis_pool, _enhance_items, items, restaurant_name, restaurant_categories
+                )
+            except Exception as e:
+                print(f"   ⚠️ Analysis pool unavailable, analysing in-process: {e}")
+                self.analysis_workers = 1
+        return _enhance_items(items, restaurant_name, restaurant_categories)
+    
+    async def _enhance_menu_item(self, item: Dict[str, Any], restaurant: Dict[str, Any]) -> MenuItem:
+        """Enhance menu item with comprehensive allergen analysis"""
+        return _enhance_item(item, restaurant.get('name', ''), restaurant.get('categories', []))
     
     def _extract_nutritional_hints(self, text: str) -> Dict[str, Any]:
         """Extract nutritional hints from text"""
-        text_lower = text.lower()
-        
-        return {
-            'likely_high_protein': bool(re.search(r'\b(protein|chicken|beef|fish|tofu|beans|lentils|quinoa|steak|salmon|tuna|shrimp|lobster)\b', text_lower)),
-            'likely_high_fat': bool(re.search(r'\b(fried|butter|oil|cream|cheese|avocado|nuts|bacon|sausage)\b', text_lower)),
-            'likely_high_carb': bool(re.search(r'\b(pasta|rice|bread|potato|noodles|flour|pizza|sandwich)\b', text_lower)),
-            'likely_high_fiber': bool(re.search(r'\b(beans|lentils|quinoa|oats|vegetables|whole grain|salad|spinach|kale)\b', text_lower)),
-            'likely_low_calorie': bool(re.search(r'\b(salad|steamed|grilled|light|fresh|raw|vegetable|fruit)\b', text_lower)),
-            'contains_vegetables': bool(re.search(r'\b(vegetables|veggie|lettuce|tomato|onion|pepper|spinach|kale|broccoli|carrot)\b', text_lower)),
-            'contains_fruits': bool(re.search(r'\b(apple|banana|berry|citrus|fruit|orange|strawberry|mango|pineapple)\b', text_lower)),
-            'spicy_level': len(re.findall(r'\b(spicy|hot|jalapeño|habanero|sriracha|chili|pepper|cayenne)\b', text_lower))
-        }
+        return _nutritional_hints(text)
     
     def _calculate_confidence_score(self, allergen_analysis, item: Dict[str, Any]) -> float:
         """Calculate confidence score for menu item analysis"""
-        base_score = 0.6
-        
-        # Boost confidence based on available data
-        if item.get('description') and len(item['description']) > 20:
-            base_score += 0.2
-        
-        if item.get('name') and len(item['name']) > 5:
-            base_score += 0.1
-        
-        if item.get('price'):
-            base_score += 0.1
-        
-        # Adjust based on allergen detection confidence
-        if allergen_analysis.confidence_scores:
-            avg_allergen_confidence = sum(allergen_analysis.confidence_scores.values()) / len(allergen_analysis.confidence_scores)
-            base_score = (base_score + avg_allergen_confidence) / 2
-        
-        return min(base_score, 1.0)
+        return _confidence_score(allergen_analysis, item)
     
-    def _analyze_restaurant_allergens(self, restaurant: Dict[str, Any], menu_items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_restaurant_allergens(self, restaurant: Dict[str, Any], menu_items: List[MenuItem]) -> Dict[str, Any]:
         """Analyze restaurant-level allergen information"""
         if not menu_items:
             return {
@@ -645,122 +1146,124 @@ class EnhancedWebsiteMenuScraper:
                 'risk_assessment': 'unknown'
             }
         
-        # Aggregate allergen data
-        allergen_counts = {}
-        dietary_tags = set()
-        risk_levels = {'high': 0, 'medium': 0, 'low': 0, 'unknown': 0}
+        # Aggregate allergen data in one pass over the items, gathering flat
+        # label lists that are then counted (or de-duplicated) in one C call each
+        allergens = []
+        dietary_tags = []
+        risk_level_labels = []
+        add_allergens = allergens.extend
+        add_dietary_tags = dietary_tags.extend
+        add_risk_level = risk_level_labels.append
+        items_with_allergens = 0
         
         for item in menu_items:
-            allergen_analysis = item.get('allergen_analysis', {})
-            
-            # Count allergens
-            for allergen in allergen_analysis.get('detected_allergens', []):
-                allergen_counts[allergen] = allergen_counts.get(allergen, 0) + 1
-            
-            # Collect dietary tags
-            for tag in allergen_analysis.get('dietary_tags', []):
-                dietary_tags.add(tag)
-            
-            # Count risk levels
-            risk_level = allergen_analysis.get('risk_level', 'unknown')
-            risk_levels[risk_level] += 1
+            allergen_analysis = item.allergen_analysis
+            detected_allergens = allergen_analysis.get('detected_allergens', ())
+            add_allergens(detected_allergens)
+            add_dietary_tags(allergen_analysis.get('dietary_tags', ()))
+            add_risk_level(allergen_analysis.get('risk_level', 'unknown'))
+            if detected_allergens:
+                items_with_allergens += 1
+        
+        # Count allergens
+        allergen_counts = Counter(allergens)
+        
+        # Count risk levels
+        risk_levels = dict.fromkeys(_RISK_LEVELS, 0)
+        risk_levels.update(Counter(risk_level_labels))
         
         # Determine overall restaurant risk
         total_items = len(menu_items)
         high_risk_percentage = (risk_levels['high'] / total_items) * 100 if total_items > 0 else 0
         
-        overall_risk = 'high' if high_risk_percentage > 30 else \
-                      'medium' if high_risk_percentage > 10 else \
-                      'low' if risk_levels['low'] > 0 else 'unknown'
+        overall_risk = _RISK_LABELS[bisect.bisect_left(_RISK_THRESHOLDS, high_risk_percentage)] or \
+                      ('low' if risk_levels['low'] > 0 else 'unknown')
         
         return {
             'total_menu_items': total_items,
-            'allergen_summary': allergen_counts,
-            'dietary_options': list(dietary_tags),
+            'allergen_summary': dict(allergen_counts),
+            'dietary_options': list(set(dietary_tags)),
             'risk_assessment': overall_risk,
             'risk_distribution': risk_levels,
-            'allergen_coverage_percent': round((sum(1 for item in menu_items 
-                                                   if item.get('allergen_analysis', {}).get('detected_allergens')) / total_items) * 100, 2) if total_items > 0 else 0
+            'allergen_coverage_percent': _percent(items_with_allergens, total_items)
         }
     
     def _generate_comprehensive_analysis(self, restaurants: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate comprehensive analysis of all data"""
         total_restaurants = len(restaurants)
-        successful_restaurants = [r for r in restaurants if r.get('menu_extraction_success', False)]
-        total_menu_items = sum(len(r.get('enhanced_menu_items', [])) for r in successful_restaurants)
+        successful_count = 0
+        restaurants_with_allergens = 0
+        total_menu_items = 0
         
-        # Allergen analysis
-        allergen_counts = {}
-        total_allergen_detections = 0
+        # Allergen and dietary analysis, one pass over the restaurants and their
+        # items. Labels are gathered into flat lists and each list is counted by
+        # one Counter call, which runs the whole tally in C instead of one
+        # update() per item
+        allergens = []
+        dietary_tags = []
+        add_allergens = allergens.extend
+        add_dietary_tags = dietary_tags.extend
         high_risk_items = 0
         
-        # Dietary analysis
-        dietary_counts = {}
-        total_dietary_tags = 0
+        for restaurant in restaurants:
+            if not restaurant.get('menu_extraction_success', False):
+                continue
+            successful_count += 1
+            if (restaurant.get('restaurant_allergen_summary') or _EMPTY).get('allergen_coverage_percent', 0) > 0:
+                restaurants_with_allergens += 1
+            
+            menu_items = restaurant.get('enhanced_menu_items', ())
+            total_menu_items += len(menu_items)
+            for item in menu_items:
+                allergen_analysis = item.allergen_analysis
+                # _enhance_item always fills these keys; .get only for foreign items
+                try:
+                    detected_allergens = allergen_analysis['detected_allergens']
+                    item_dietary_tags = allergen_analysis['dietary_tags']
+                    risk_level = allergen_analysis['risk_level']
+                except KeyError:
+                    detected_allergens = allergen_analysis.get('detected_allergens', ())
+                    item_dietary_tags = allergen_analysis.get('dietary_tags', ())
+                    risk_level = allergen_analysis.get('risk_level')
+                add_allergens(detected_allergens)
+                add_dietary_tags(item_dietary_tags)
+                high_risk_items += risk_level == 'high'
         
-        for restaurant in successful_restaurants:
-            for item in restaurant.get('enhanced_menu_items', []):
-                allergen_analysis = item.get('allergen_analysis', {})
-                
-                # Count allergens
-                detected_allergens = allergen_analysis.get('detected_allergens', [])
-                total_allergen_detections += len(detected_allergens)
-                
-                for allergen in detected_allergens:
-                    allergen_counts[allergen] = allergen_counts.get(allergen, 0) + 1
-                
-                # Count high-risk items
-                if allergen_analysis.get('risk_level') == 'high':
-                    high_risk_items += 1
-                
-                # Count dietary tags
-                dietary_tags = allergen_analysis.get('dietary_tags', [])
-                total_dietary_tags += len(dietary_tags)
-                
-                for tag in dietary_tags:
-                    dietary_counts[tag] = dietary_counts.get(tag, 0) + 1
+        allergen_counts = Counter(allergens)
+        dietary_counts = Counter(dietary_tags)
+        total_allergen_detections = len(allergens)
+        total_dietary_tags = len(dietary_tags)
         
         return {
             'allergen_analysis': {
                 'total_allergen_detections': total_allergen_detections,
                 'high_risk_items': high_risk_items,
-                'allergen_distribution': allergen_counts,
-                'top_allergens': sorted(allergen_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+                'allergen_distribution': dict(allergen_counts),
+                'top_allergens': allergen_counts.most_common(10)
             },
             'dietary_analysis': {
                 'total_dietary_tags': total_dietary_tags,
-                'dietary_distribution': dietary_counts,
-                'top_dietary_options': sorted(dietary_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+                'dietary_distribution': dict(dietary_counts),
+                'top_dietary_options': dietary_counts.most_common(10)
             },
             'health_insights': {
-                'restaurants_with_menu_data': len(successful_restaurants),
-                'average_menu_items_per_restaurant': round(total_menu_items / len(successful_restaurants), 2) if successful_restaurants else 0,
-                'allergen_coverage_percent': round((sum(1 for r in successful_restaurants 
-                                                       if r.get('restaurant_allergen_summary', {}).get('allergen_coverage_percent', 0) > 0) / len(successful_restaurants)) * 100, 2) if successful_restaurants else 0,
-                'health_app_readiness': 'excellent' if total_menu_items > 80 and total_allergen_detections > 40 else 
-                                       'good' if total_menu_items > 40 and total_allergen_detections > 20 else 
-                                       'fair' if total_menu_items > 15 else 'poor'
+                'restaurants_with_menu_data': successful_count,
+                'average_menu_items_per_restaurant': round(total_menu_items / successful_count, 2) if successful_count else 0,
+                'allergen_coverage_percent': _percent(restaurants_with_allergens, successful_count),
+                'health_app_readiness': next((label for min_items, min_detections, label in _READINESS_TIERS
+                                              if total_menu_items > min_items and total_allergen_detections > min_detections), 'poor')
             }
         }
 
     async def scrape_restaurant_menu(self, restaurant_name: str, direct_url: str = None) -> Dict[str, Any]:
         """Public method to scrape a single restaurant's menu"""
-        if not await self.setup_browser():
-            return {
-                "url": direct_url or "",
-                "success": False,
-                "items": [],
-                "total_items": 0,
-                "processing_time": 0,
-                "extraction_method": None,
-                "allergen_summary": {},
-                "price_coverage": 0,
-                "menu_image_urls": [],
-                "ocr_texts": [],
-                "error": "Browser setup failed"
-            }
+        menu_result = _empty_menu_result(direct_url or "")
+        owns_browser = self.browser is None
+        if owns_browser and not await self.setup_browser():
+            menu_result["error"] = "Browser setup failed"
+            return menu_result
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Create restaurant data structure
@@ -772,48 +1275,46 @@ class EnhancedWebsiteMenuScraper:
             # Use existing private method
             result = await self._scrape_restaurant_website(restaurant_data)
             
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             # Format result for compatibility
             menu_items = result.get('enhanced_menu_items', [])
             
-            return {
-                "url": direct_url or "",
+            items = []
+            priced_items = 0
+            for item in menu_items:
+                name, price, description, allergen_analysis = _MENU_ROW_FIELDS(item)
+                if price:
+                    priced_items += 1
+                items.append({
+                    "name": name,
+                    "price": price,
+                    "description": description,
+                    "allergens": allergen_analysis.get('detected_allergens', [])
+                })
+            
+            menu_result.update({
                 "success": result.get('menu_extraction_success', False),
-                "items": [{
-                    "name": item.get('name', ''),
-                    "price": item.get('price', ''),
-                    "description": item.get('description', ''),
-                    "allergens": item.get('allergen_analysis', {}).get('detected_allergens', [])
-                } for item in menu_items],
+                "items": items,
                 "total_items": len(menu_items),
                 "processing_time": round(processing_time, 2),
                 "extraction_method": "website_scraping",
                 "allergen_summary": result.get('restaurant_allergen_summary', {}),
-                "price_coverage": len([item for item in menu_items if item.get('price')]) / len(menu_items) if menu_items else 0,
-                "menu_image_urls": [],
-                "ocr_texts": [],
+                "price_coverage": priced_items / len(menu_items) if menu_items else 0,
                 "error": result.get('extraction_error')
-            }
+            })
+            return menu_result
             
         except Exception as e:
-            processing_time = time.time() - start_time
-            return {
-                "url": direct_url or "",
-                "success": False,
-                "items": [],
-                "total_items": 0,
+            processing_time = time.perf_counter() - start_time
+            menu_result.update({
                 "processing_time": round(processing_time, 2),
-                "extraction_method": None,
-                "allergen_summary": {},
-                "price_coverage": 0,
-                "menu_image_urls": [],
-                "ocr_texts": [],
                 "error": f"Navigation failed: {str(e)}"
-            }
+            })
+            return menu_result
         finally:
-            if self.browser:
-                await self.browser.close()
+            if owns_browser:
+                await self.close()
 
 async def main():
     """Main function to run enhanced website menu scraping"""
@@ -20,15 +20,20 @@ import sys
 import os
 from typing import Dict, List, Any
 from datetime import datetime
+from functools import lru_cache
 import json
 
 # Add the current directory to Python path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from supabase_integration import SupabaseIntegration, RestaurantData, MenuItemData
-from dotenv import load_dotenv
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -36,28 +41,59 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1)
+def _load_env():
+    """Load .env into the environment, once per process"""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+def _print_json(data: Any):
+    """Print data as indented JSON, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        # Datetimes and dataclasses go through default=str like the json path
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE |
+                   orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS,
+            default=str
+        ))
+        sys.stdout.flush()
+    else:
+        print(json.dumps(data, indent=2, default=str))
+
 class MenuScraperIntegration:
     """Integration class that combines scraping with database storage"""
     
     def __init__(self):
-        """Initialize the integration with Supabase connection"""
-        load_dotenv()
-        
-        try:
-            self.db = SupabaseIntegration()
-            logger.info("Successfully connected to Supabase")
-        except Exception as e:
-            logger.error(f"Failed to connect to Supabase: {e}")
-            logger.error("Please check your SUPABASE_URL and SUPABASE_KEY environment variables")
-            sys.exit(1)
+        """Initialize the integration; the Supabase connection opens on first use"""
+        self._db = None
     
-    async def scrape_and_store(self, restaurant_url: str, scraper_type: str = 'auto') -> Dict[str, Any]:
+    @property
+    def db(self):
+        """Supabase connection, opened (and its client library imported) by
+        the first database call so CLI paths that never reach one skip it"""
+        if self._db is None:
+            _load_env()
+            
+            try:
+                from supabase_integration import SupabaseIntegration
+                self._db = SupabaseIntegration()
+                logger.info("Successfully connected to Supabase")
+            except Exception as e:
+                logger.error(f"Failed to connect to Supabase: {e}")
+                logger.error("Please check your SUPABASE_URL and SUPABASE_KEY environment variables")
+                sys.exit(1)
+        return self._db
+    
+    async def scrape_and_store(self, restaurant_url: str, scraper_type: str = 'auto', delay: float = 0.0) -> Dict[str, Any]:
         """
         Scrape a restaurant and store results in Supabase
         
         Args:
             restaurant_url: URL of the restaurant to scrape
             scraper_type: Type of scraper to use
+            delay: Simulated scraping delay in seconds for the mock scraper
             
         Returns:
             Summary of the scraping and storage operation
@@ -67,7 +103,7 @@ class MenuScraperIntegration:
         try:
             # For demonstration, we'll create mock data
             # In a real implementation, you would call your actual scrapers here
-            scraped_data = await self._mock_scrape_restaurant(restaurant_url)
+            scraped_data = await self._mock_scrape_restaurant(restaurant_url, delay)
             
             # Store the scraped data in Supabase
             summary = await self.db.save_scraping_results(scraped_data, scraper_type)
@@ -84,15 +120,19 @@ class MenuScraperIntegration:
                 'menu_items_created': 0
             }
     
-    async def _mock_scrape_restaurant(self, url: str) -> Dict[str, Any]:
+    async def _mock_scrape_restaurant(self, url: str, delay: float = 0.0) -> Dict[str, Any]:
         """
         Mock scraper that generates sample restaurant data
         In a real implementation, this would be replaced with actual scraping logic
+        
+        Only the demo simulates a scraping delay; other callers (and benchmarks)
+        get the data straight away
         """
         logger.info("Running mock scraper (replace with actual scraper integration)")
         
         # Simulate scraping delay
-        await asyncio.sleep(2)
+        if delay > 0:
+            await asyncio.sleep(delay)
         
         # Generate mock restaurant data
         restaurant_name = f"Restaurant from {url.split('//')[-1].split('/')[0]}"
@@ -232,14 +272,19 @@ class MenuScraperIntegration:
         
         restaurant_ids = []
         
-        # Scrape and store demo restaurants
-        for url in demo_urls:
-            logger.info(f"\n--- Scraping {url} ---")
-            summary = await self.scrape_and_store(url, 'demo_scraper')
-            
-            if summary['success']:
+        # Scrape and store demo restaurants concurrently
+        logger.info(f"\n--- Scraping {len(demo_urls)} restaurants ---")
+        summaries = await asyncio.gather(
+            *(self.scrape_and_store(url, 'demo_scraper', delay=2.0) for url in demo_urls),
+            return_exceptions=True
+        )
+        
+        for url, summary in zip(demo_urls, summaries):
+            if isinstance(summary, Exception):
+                logger.error(f"✗ Failed to scrape {url}: {summary}")
+            elif summary['success']:
                 restaurant_ids.append(summary['restaurant_id'])
-                logger.info(f"✓ Successfully stored {summary['menu_items_created']} menu items")
+                logger.info(f"✓ {url}: successfully stored {summary['menu_items_created']} menu items")
             else:
                 logger.error(f"✗ Failed to scrape {url}: {summary.get('error', 'Unknown error')}")
         
@@ -335,11 +380,11 @@ def main():
         elif args.scrape_url:
             logger.info(f"Scraping URL: {args.scrape_url}")
             summary = await integration.scrape_and_store(args.scrape_url)
-            print(json.dumps(summary, indent=2, default=str))
+            _print_json(summary)
         
         elif args.query_restaurants:
             restaurants = await integration.query_restaurants(city=args.city, cuisine_type=args.cuisine)
-            print(json.dumps(restaurants, indent=2, default=str))
+            _print_json(restaurants)
         
         else:
             parser.print_help()
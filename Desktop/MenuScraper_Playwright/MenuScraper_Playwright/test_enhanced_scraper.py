@@ -3,6 +3,7 @@
 Test script for the enhanced menu scraper using real Chicago restaurant data
 """
 
+import asyncio
 import json
 from enhanced_menu_scraper import EnhancedMenuScraper
 
@@ -37,7 +38,13 @@ def test_enhanced_scraper():
     results = []
     success_count = 0
     
-    for i, restaurant in enumerate(test_restaurants, 1):
+    # Scrape all test restaurants concurrently on one shared browser
+    try:
+        menu_results = asyncio.run(scraper.scrape_many([r.get('url') for r in test_restaurants]))
+    except Exception as e:
+        menu_results = [{'scraping_success': False, 'error': str(e)} for _ in test_restaurants]
+    
+    for i, (restaurant, menu_data) in enumerate(zip(test_restaurants, menu_results), 1):
         print(f"\n{'='*60}")
         print(f"🏪 [{i}/{len(test_restaurants)}] Testing: {restaurant['name']}")
         print(f"🌐 URL: {restaurant.get('url', 'N/A')}")
@@ -45,35 +52,19 @@ def test_enhanced_scraper():
         print(f"💰 Price: {restaurant.get('price', 'N/A')}")
         print(f"📍 Location: {restaurant.get('location', {}).get('address1', 'N/A')}")
         
-        try:
-            # Use Playwright to scrape menu using enhanced method
-            from playwright.sync_api import sync_playwright
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-                
-                # Scrape menu using enhanced method
-                menu_data = scraper.enhanced_menu_detection(page, restaurant.get('url'))
-                
-                # Update restaurant data with menu information
-                restaurant.update(menu_data)
-                results.append(restaurant)
-                
-                browser.close()
-            
-            if menu_data.get('scraping_success'):
-                success_count += 1
-                print(f"✅ Success! Found {menu_data.get('total_items', 0)} menu items")
-                if menu_data.get('ocr_used'):
-                    print(f"📸 OCR was used for extraction")
-            else:
-                print(f"❌ No menu items found")
-                
-        except Exception as e:
-            print(f"💥 Error scraping {restaurant['name']}: {str(e)}")
-            restaurant['scraping_success'] = False
-            restaurant['error'] = str(e)
-            results.append(restaurant)
+        # Update restaurant data with menu information
+        restaurant.update(menu_data)
+        results.append(restaurant)
+        
+        if menu_data.get('error'):
+            print(f"💥 Error scraping {restaurant['name']}: {menu_data['error']}")
+        elif menu_data.get('scraping_success'):
+            success_count += 1
+            print(f"✅ Success! Found {menu_data.get('total_items', 0)} menu items")
+            if menu_data.get('ocr_used'):
+                print(f"📸 OCR was used for extraction")
+        else:
+            print(f"❌ No menu items found")
     
     # Calculate and display results
     success_rate = (success_count / len(test_restaurants)) * 100
@@ -114,5 +105,14 @@ def test_enhanced_scraper():
     
     print(f"\n🎉 Enhanced scraper test completed!")
 
+def test_split_menu_item_text_prefers_dollar_price():
+    """A $-prefixed price wins over a bare number earlier in the item text"""
+    scraper = EnhancedMenuScraper()
+
+    assert scraper._split_menu_item_text("Buffalo Wings 10 $14.99") == ("Buffalo Wings 10", "Buffalo Wings 10", "$14.99")
+    assert scraper._split_menu_item_text("Tacos 3 $12") == ("Tacos 3", "Tacos 3", "$12")
+    assert scraper._split_menu_item_text("House Salad 9.50 $")[2] == "$9.50"
+    assert scraper._split_menu_item_text("Soup of the day")[2] is None
+
 if __name__ == "__main__":
     test_enhanced_scraper()
\ No newline at end of file